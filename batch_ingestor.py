@@ -0,0 +1,57 @@
+"""
+Batch Ingestor Module
+Reads many text files concurrently and counts their words, either combined
+into one table or per file.
+"""
+
+from collections import Counter
+from typing import Iterable, Iterator, Optional, Tuple
+
+from config_module import Config
+from file_manager import FileManager
+from text_processor import TextProcessor
+from word_counter import WordCounter
+
+
+class BatchIngestor:
+    """
+    Counts words across directories, glob patterns and manifest files.
+
+    File reads overlap on a thread pool while the calling thread tokenizes
+    and counts, so per-file open/read latency is hidden behind processing.
+    """
+
+    def __init__(
+        self,
+        file_manager: Optional[FileManager] = None,
+        text_processor: Optional[TextProcessor] = None,
+        word_counter: Optional[WordCounter] = None,
+    ):
+        """Initialize the ingestor with its collaborators."""
+        self.config = Config()
+        self.file_manager = file_manager or FileManager()
+        self.text_processor = text_processor or TextProcessor()
+        self.word_counter = word_counter or WordCounter()
+
+    def iter_file_counts(
+        self, sources: Iterable[str], max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, Counter]]:
+        """
+        Yield (path, word counts) for every input file, in input order.
+        """
+        filepaths = self.file_manager.collect_input_files(sources)
+        for filepath, text in self.file_manager.read_text_files(filepaths, max_workers):
+            yield filepath, self.word_counter.count_words(
+                self.text_processor.process_text_fast(text)
+            )
+
+    def count_combined(
+        self, sources: Iterable[str], max_workers: Optional[int] = None
+    ) -> Counter:
+        """
+        Count the words of every input file into a single table.
+        """
+        word_count = Counter()
+        for _, file_count in self.iter_file_counts(sources, max_workers):
+            word_count.update(file_count)
+        return word_count
@@ -0,0 +1,103 @@
+"""
+Batch Renderer Module
+Renders many word clouds in parallel across a pool of worker processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config_module import Config
+from wordcloud_visualizer import WordCloudVisualizer
+
+# A render job: (word frequencies, render options, output path)
+RenderJob = Tuple[Dict[str, int], Dict[str, Any], str]
+
+# Per-worker visualizer, created once by _init_worker
+_worker_visualizer = None
+
+
+def _init_worker(layout_engine: str):
+    """Set up the visualizer used by a worker process."""
+    global _worker_visualizer
+    _worker_visualizer = WordCloudVisualizer()
+    _worker_visualizer.headless = True
+    _worker_visualizer.config.LAYOUT_ENGINE = layout_engine
+
+
+def _render_job(job: RenderJob) -> Dict[str, Any]:
+    """Render a single job inside a worker process, capturing any failure."""
+    word_count, options, output_path = job
+    try:
+        wordcloud = _worker_visualizer.generate_word_cloud(word_count, **options)
+        if wordcloud is None:
+            return {"output_path": output_path, "success": False, "error": "No words to display"}
+
+        wordcloud.to_file(output_path)
+        return {"output_path": output_path, "success": True, "error": None}
+    except Exception as e:
+        return {"output_path": output_path, "success": False, "error": f"{type(e).__name__}: {e}"}
+
+
+class BatchRenderer:
+    """
+    Renders a list of word cloud jobs over a process pool.
+
+    Each job is (frequencies, render options, output path), where the
+    options are keyword arguments of WordCloudVisualizer.generate_word_cloud.
+    Masks are sent as paths, never as arrays, and each worker keeps the
+    ones it loads in memory; with Config.USE_MASK_DISK_CACHE they are also
+    prepared once into the on-disk mask cache before the pool starts. A failing job is reported in its result
+    without stopping the rest of the batch.
+
+    Workers lay words out with layout_engine (Config.BATCH_LAYOUT_ENGINE by
+    default); with "native", each worker's glyph cache carries measured
+    words over from one job to the next.
+    """
+
+    def __init__(self, workers: Optional[int] = None, layout_engine: Optional[str] = None):
+        """Initialize the renderer with configuration."""
+        self.config = Config()
+        self.workers = workers or self.config.BATCH_RENDER_WORKERS or os.cpu_count() or 1
+        self.layout_engine = layout_engine or self.config.BATCH_LAYOUT_ENGINE
+        self.visualizer = WordCloudVisualizer()
+
+    def render(self, jobs: Iterable[RenderJob]) -> List[Dict[str, Any]]:
+        """
+        Render every job and return one result per job, in job order.
+
+        Each result holds 'output_path', 'success' and 'error'.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+
+        if self.visualizer.mask_cache.persist:
+            self._prepare_masks(jobs)
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(jobs)),
+            initializer=_init_worker,
+            initargs=(self.layout_engine,),
+        ) as executor:
+            futures = [executor.submit(_render_job, job) for job in jobs]
+            for (_, _, output_path), future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # The worker itself died, e.g. it ran out of memory
+                    results.append(
+                        {"output_path": output_path, "success": False, "error": f"{type(e).__name__}: {e}"}
+                    )
+        return results
+
+    def _prepare_masks(self, jobs: List[RenderJob]):
+        """Write every mask used by the batch to the on-disk mask cache."""
+        size = (self.visualizer.width, self.visualizer.height)
+        mask_paths = {options.get("mask_image_path") for _, options, _ in jobs}
+        for mask_path in sorted(path for path in mask_paths if path):
+            try:
+                self.visualizer.mask_cache.load(mask_path, size)
+            except OSError as e:
+                print(f"Could not load mask image: {e}")
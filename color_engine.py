@@ -0,0 +1,78 @@
+"""
+Color Engine Module
+Assigns colors to every word of a word cloud layout in one vectorized step.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config_module import Config
+
+
+class ColorEngine:
+    """
+    Colors a whole word cloud layout at once from a color scheme.
+
+    A scheme in Config.COLOR_SCHEMES is one of:
+    - None: each word gets a random color sampled from Config.DEFAULT_COLORMAP
+    - a list of colors: each word gets a random color from the palette
+    - a colormap name: a frequency-ranked gradient, where words with equal
+      frequency share a color and the most frequent words take the end of
+      the colormap
+
+    Random choices are drawn from a NumPy generator seeded with
+    random_state, so the same layout and scheme always get the same colors.
+    """
+
+    def __init__(self, random_state: Optional[int] = None):
+        """Initialize the engine with configuration."""
+        self.config = Config()
+        self.random_state = random_state
+
+    def assign_colors(self, layout: list, color_scheme: str = "random",
+                      previous: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Return one color per entry of a WordCloud layout_, in layout order.
+
+        Words found in previous (word -> color) keep that color, so a word
+        does not change color from one animation frame to the next; with a
+        gradient scheme colors follow the current frequencies instead.
+        Unknown schemes fall back to the default random colors.
+        """
+        if not layout:
+            return []
+
+        scheme = self.config.COLOR_SCHEMES.get(color_scheme)
+        rng = np.random.default_rng(self.random_state)
+
+        if isinstance(scheme, str):
+            frequencies = np.fromiter((entry[0][1] for entry in layout), dtype=np.float64, count=len(layout))
+            return self.gradient_colors(frequencies, scheme)
+
+        if scheme:
+            palette = np.array(scheme, dtype=object)
+            colors = palette[rng.integers(len(palette), size=len(layout))].tolist()
+        else:
+            colors = self._colormap_colors(self.config.DEFAULT_COLORMAP, rng.random(len(layout)))
+
+        if previous:
+            colors = [previous.get(entry[0][0], color) for entry, color in zip(layout, colors)]
+        return colors
+
+    def gradient_colors(self, frequencies: np.ndarray, colormap: str) -> List[str]:
+        """
+        Color frequencies by rank along a colormap, lowest frequency first.
+        """
+        distinct, ranks = np.unique(frequencies, return_inverse=True)
+        positions = ranks / max(1, len(distinct) - 1)
+        return self._colormap_colors(colormap, positions)
+
+    @staticmethod
+    def _colormap_colors(colormap: str, positions: np.ndarray) -> List[str]:
+        """Sample a matplotlib colormap at positions in [0, 1] as 'rgb(...)' strings."""
+        # matplotlib.colormaps does not import pyplot
+        from matplotlib import colormaps
+
+        rgb = np.rint(255 * colormaps[colormap](positions)[:, :3]).astype(np.int64)
+        return [f"rgb({r}, {g}, {b})" for r, g, b in rgb.tolist()]
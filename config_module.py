@@ -14,16 +14,76 @@ class Config:
     # Text processing settings
     DEFAULT_MAX_WORDS = 50
     MIN_WORD_LENGTH = 3
+    STREAM_CHUNK_SIZE = 1024 * 1024  # Characters (or bytes, for files) per streamed chunk
+    STREAM_MAX_FRAGMENT_LENGTH = 64 * 1024  # Longer runs without whitespace are split when streamed
+
+    # Parallel processing settings
+    PARALLEL_WORKERS = None  # None uses os.cpu_count()
+    PARALLEL_SHARD_SIZE = 4 * 1024 * 1024  # Characters per worker task
+    PARALLEL_MIN_TEXT_SIZE = 16 * 1024 * 1024  # Smaller texts are processed serially
+
+    # Vectorized counting settings
+    USE_VECTORIZED_COUNTING = False  # Count interned word ids with NumPy
+
+    # Approximate counting settings
+    USE_APPROXIMATE_COUNTING = False
+    APPROXIMATE_COUNTER_CAPACITY = 100000  # Words tracked by the approximate counter
+
+    # Trending (live stream) counting settings
+    TRENDING_WINDOW_SECONDS = 3600  # Sliding window length
+    TRENDING_HALF_LIFE_SECONDS = 600  # Half-life for time-decayed counts
 
     # Visualization settings
     DEFAULT_WIDTH = 800
     DEFAULT_HEIGHT = 600
     DEFAULT_COLOR_SCHEME = "random"
     DEFAULT_BACKGROUND_COLOR = "black"
+    DEFAULT_COLORMAP = "viridis"  # Used by the "random" color scheme
+    HEADLESS_RENDERING = False  # Write images to disk instead of showing a window
+    BATCH_RENDER_WORKERS = None  # Processes for batch rendering; None uses os.cpu_count()
+    BATCH_LAYOUT_ENGINE = "native"  # LAYOUT_ENGINE used by batch rendering workers
+    PREVIEW_SCALE = 4  # Previews are laid out on a canvas this many times smaller
+    # "wordcloud" (library placement) or "native" (NumPy summed-area tables).
+    # Only the native engine uses the glyph cache below; the library engine
+    # measures every word with the font again on each render. BatchRenderer
+    # uses BATCH_LAYOUT_ENGINE instead.
+    LAYOUT_ENGINE = "wordcloud"
+    NATIVE_LAYOUT_CELL_SIZE = 4  # Pixels per coarse cell in the native engine's first search pass
+    GLYPH_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Measured and rasterized words kept across native renders
+    FONT_CACHE_SIZE = 256  # Loaded (font, size, orientation) combinations kept across renders
+    POSTER_LAYOUT_MAX_PIXELS = 2000000  # Posters are laid out at most this large, then scaled up
+    POSTER_BAND_HEIGHT = 256  # Rows drawn and encoded at a time when rendering posters
+    POSTER_COMPRESSION_LEVEL = 6  # zlib level for streamed PNG output
+    SEQUENCE_RESIZE_TOLERANCE = 0.25  # Relative font-size change before a word in a sequence is re-placed
+    SEQUENCE_FRAME_DURATION_MS = 1000  # Display time of each frame in animated sequences
+
+    # Exporting one rendered cloud to several files
+    EXPORT_FORMATS = ["png", "jpeg", "webp"]  # Any of ImageExporter.FORMATS
+    EXPORT_THUMBNAIL_SIZES = [(400, 300), (200, 150)]  # Boxes thumbnails are fitted into
+    EXPORT_THUMBNAIL_FORMAT = "webp"
+    EXPORT_QUALITY = 90  # JPEG and WebP quality
+    EXPORT_WORKERS = None  # Encoding threads; None uses os.cpu_count()
 
     # File settings
     SAMPLE_DIRECTORY = "samples"
     DEFAULT_SAVE_FORMAT = "png"
+    FILE_ENCODINGS = ["utf-8", "cp1252", "latin-1"]  # Tried in order when reading files
+
+    # Frequency cache settings
+    # Reuse word counts of files processed before. Off by default: it writes
+    # FREQUENCY_CACHE_DIRECTORY in the working directory, and cached tables
+    # break ties between equally frequent words alphabetically rather than
+    # in order of first appearance
+    USE_FREQUENCY_CACHE = False
+    FREQUENCY_CACHE_DIRECTORY = ".wordcloud_cache"
+    FREQUENCY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+    # Watch mode settings
+    WATCH_INTERVAL_SECONDS = 5.0  # Time between checks for appended data
+
+    # Batch ingestion settings
+    BATCH_FILE_PATTERNS = ["*.txt", "*.txt.gz", "*.txt.bz2", "*.txt.xz"]  # Picked up from directories
+    BATCH_READ_WORKERS = 16  # Threads reading files concurrently
 
     # Stop words - common words to exclude from word clouds
     STOP_WORDS = {
@@ -113,8 +173,22 @@ class Config:
         "sunset": ["#FF6B6B", "#FF8E53", "#FF6B35", "#C44536", "#8B2635"],
         "forest": ["#2D5016", "#3E7B27", "#4F9A31", "#6AB04C", "#9DC209"],
         "monochrome": ["#2C3E50", "#34495E", "#7F8C8D", "#95A5A6", "#BDC3C7"],
+        "heat": "YlOrRd",  # Gradient by frequency rank, most frequent last
+        "spectrum": "plasma",  # Gradient by frequency rank, most frequent last
     }
 
+    # Prepared masks are cached in memory, and optionally on disk
+    USE_MASK_DISK_CACHE = False  # Also keep prepared masks on disk, across runs and batch workers
+    MASK_CACHE_DIRECTORY = os.path.join(".wordcloud_cache", "masks")
+    MASK_CACHE_MAX_ENTRIES = 16  # Kept in memory
+    MASK_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Kept on disk; least recently used are deleted
+
+    # Computed layouts are cached so recoloring skips word placement
+    USE_LAYOUT_DISK_CACHE = False  # Also keep layouts on disk, across runs and batch workers
+    LAYOUT_CACHE_DIRECTORY = os.path.join(".wordcloud_cache", "layouts")
+    LAYOUT_CACHE_MAX_ENTRIES = 8  # Kept in memory
+    LAYOUT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Kept on disk; least recently used are deleted
+
     PREDEFINED_MASKS = {
         'rectangle': None, # Default shape, no mask needed
         'circle': os.path.join(os.path.dirname(__file__), 'shapes', 'circle_mask.png'),
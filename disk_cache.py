@@ -0,0 +1,94 @@
+"""
+Disk Cache Module
+Size accounting and least-recently-used eviction shared by the on-disk caches.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+
+def scan_cache_files(directory: str, suffix: str) -> List[Tuple[float, str, int]]:
+    """
+    Return (modification time, path, size) for every file ending in suffix
+    in directory or its subdirectories.
+    """
+    entries = []
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if not filename.endswith(suffix):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed by another process
+            entries.append((stat.st_mtime, path, stat.st_size))
+    return entries
+
+
+def evict_lru_files(directory: str, suffix: str, max_bytes: int) -> int:
+    """
+    Delete the least recently modified cache files until the rest fit in
+    max_bytes, and return their total size.
+    """
+    entries = scan_cache_files(directory, suffix)
+    total_size = sum(size for _, _, size in entries)
+
+    entries.sort()
+    for _, path, size in entries:
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Already removed by another process
+        total_size -= size
+    return total_size
+
+
+def touch(path: str):
+    """Mark a cache file as recently used."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+class DiskUsage:
+    """
+    Tracks the size of a cache directory as entries are written, and runs
+    evict_lru_files only once the tracked size exceeds max_bytes.
+
+    The directory is scanned once, on the first write, and again on each
+    eviction, which also picks up what other processes wrote meanwhile.
+    Eviction trims down to LOW_WATER_MARK of max_bytes, so a full cache is
+    not rescanned on every write.
+    """
+
+    LOW_WATER_MARK = 0.75
+
+    def __init__(self, directory: str, suffix: str, max_bytes: int):
+        """Track files ending in suffix under directory."""
+        self.directory = directory
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.size_bytes: Optional[int] = None
+
+    def add(self, size_bytes: int):
+        """
+        Account for an entry of size_bytes just written, evicting if needed.
+        """
+        if self.size_bytes is None:
+            # The first scan already includes the new entry
+            self.size_bytes = sum(size for _, _, size in scan_cache_files(self.directory, self.suffix))
+        else:
+            self.size_bytes += size_bytes
+
+        if self.size_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Evict down to the low-water mark now."""
+        self.size_bytes = evict_lru_files(
+            self.directory, self.suffix, int(self.max_bytes * self.LOW_WATER_MARK)
+        )
@@ -3,12 +3,32 @@ File Manager Module
 Handles all file operations including reading, writing, and managing sample files.
 """
 
+import bz2
+import codecs
 import glob
+import gzip
+import itertools
+import lzma
+import mmap
 import os
-from typing import List
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from config_module import Config
 
+# Compressed input formats: name -> (header pattern, file extension, opener).
+# The bz2 header is "BZh", the block size digit, then the magic of the first
+# block (or of the end of stream, for empty input), so plain text starting
+# with "BZh" is not mistaken for an archive.
+COMPRESSION_FORMATS = {
+    "gzip": (re.compile(rb"\x1f\x8b"), ".gz", gzip.open),
+    "bz2": (re.compile(rb"BZh[1-9](1AY&SY|\x17rE8P\x90)"), ".bz2", bz2.open),
+    "xz": (re.compile(rb"\xfd7zXZ\x00"), ".xz", lzma.open),
+}
+
 
 class FileManager:
     """
@@ -66,6 +86,108 @@ class FileManager:
         filenames = [os.path.basename(file) for file in txt_files]
         return sorted(filenames)
 
+    def collect_input_files(self, sources: Iterable[str]) -> List[str]:
+        """
+        Expand directories, glob patterns and manifest files into file paths.
+
+        - A directory contributes every file matching one of
+          Config.BATCH_FILE_PATTERNS below it, recursively.
+        - A pattern containing *, ? or [ is expanded as a recursive glob
+          (** matches any number of directories).
+        - A source starting with @ names a manifest: a text file listing one
+          source per line, relative to the manifest's directory. Blank lines
+          and lines starting with # are ignored.
+        - Anything else is taken as a file path.
+
+        Duplicates are dropped and the first occurrence keeps its place.
+        A manifest that is reached again, e.g. one listing itself, is skipped.
+        """
+        return self._collect_input_files(sources, set())
+
+    def _collect_input_files(self, sources: Iterable[str], visited_manifests: set) -> List[str]:
+        """
+        Expand sources, skipping manifests already in visited_manifests.
+        """
+        paths = []
+        seen = set()
+
+        def add(path):
+            path = os.path.normpath(path)
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+
+        for source in sources:
+            if source.startswith("@"):
+                manifest_path = os.path.realpath(self.clean_file_path(source[1:]))
+                if manifest_path in visited_manifests:
+                    continue
+                visited_manifests.add(manifest_path)
+                for path in self._read_manifest(manifest_path, visited_manifests):
+                    add(path)
+                continue
+
+            source = self.clean_file_path(source)
+            if os.path.isdir(source):
+                matches = set()
+                for file_pattern in self.config.BATCH_FILE_PATTERNS:
+                    pattern = os.path.join(source, "**", file_pattern)
+                    matches.update(glob.glob(pattern, recursive=True))
+                for path in sorted(matches):
+                    if os.path.isfile(path):
+                        add(path)
+            elif any(character in source for character in "*?["):
+                for path in sorted(glob.glob(source, recursive=True)):
+                    if os.path.isfile(path):
+                        add(path)
+            else:
+                add(source)
+        return paths
+
+    def _read_manifest(self, manifest_path: str, visited_manifests: set) -> List[str]:
+        """
+        Expand the sources listed in a manifest file.
+        """
+        content = self.read_text_file(manifest_path)
+        base_directory = os.path.dirname(manifest_path)
+
+        sources = []
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            prefix = "@" if line.startswith("@") else ""
+            line = line[len(prefix):]
+            if not os.path.isabs(line):
+                line = os.path.join(base_directory, line)
+            sources.append(prefix + line)
+        return self._collect_input_files(sources, visited_manifests)
+
+    def read_text_files(
+        self, filepaths: Iterable[str], max_workers: int = None
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Read many files concurrently, yielding (path, text) in input order.
+
+        Reads run on a bounded thread pool, and only a limited number of
+        files are read ahead of the consumer, so memory stays bounded even
+        for very long file lists. Files that cannot be read yield "".
+        """
+        if max_workers is None:
+            max_workers = self.config.BATCH_READ_WORKERS
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for filepath in filepaths:
+                pending.append((filepath, executor.submit(self.read_text_file, filepath)))
+                if len(pending) >= max_workers * 2:
+                    filepath, future = pending.popleft()
+                    yield filepath, future.result()
+
+            while pending:
+                filepath, future = pending.popleft()
+                yield filepath, future.result()
+
     def get_sample_file_path(self, filename: str) -> str:
         """
         Get the full path for a sample file.
@@ -80,29 +202,194 @@ class FileManager:
             print(f"Error: File '{filepath}' not found!")
             return ""
 
-        # use utf-8 encoding
-        encodings = ["utf-8"]
+        try:
+            content = self._read_text(filepath, self.config.STREAM_CHUNK_SIZE)
+        except PermissionError:
+            print(f"Error: Permission denied reading '{filepath}'")
+            return ""
+        except UnicodeDecodeError:
+            print(f"Error: Could not decode '{filepath}' with any supported encoding.")
+            return ""
+        except Exception as e:
+            print(f"Error reading file '{filepath}': {e}")
+            return ""
+
+        if not content.strip():
+            print(f"Warning: File '{filepath}' appears to be empty.")
+            return ""
+
+        # Success - return the content
+        return content
+
+    def iter_text_file(self, filepath: str, chunk_size: int = None) -> Iterator[str]:
+        """
+        Read text from a file in chunks instead of loading it all at once.
 
-        for encoding in encodings:
+        Plain files are memory-mapped, and gzip, bz2 and xz files are
+        decompressed on the fly; either way only one chunk of bytes and one
+        chunk of decoded text exist at a time.
+
+        The encoding is the first of Config.FILE_ENCODINGS that decodes the
+        first chunk, since chunks already handed out cannot be taken back.
+        Later bytes the chosen encoding cannot decode are replaced, with a
+        warning; a file that fits in one chunk is decoded exactly as a
+        whole-file decode would. read_text_file has no such limitation.
+        """
+        if chunk_size is None:
+            chunk_size = self.config.STREAM_CHUNK_SIZE
+
+        if not os.path.exists(filepath):
+            print(f"Error: File '{filepath}' not found!")
+            return
+
+        try:
+            yield from self._iter_text_chunks(filepath, chunk_size)
+        except PermissionError:
+            print(f"Error: Permission denied reading '{filepath}'")
+        except UnicodeDecodeError:
+            print(f"Error: Could not decode '{filepath}' with any supported encoding.")
+        except Exception as e:
+            print(f"Error reading file '{filepath}': {e}")
+
+    def _iter_text_chunks(self, filepath: str, chunk_size: int) -> Iterator[str]:
+        """
+        Decode a plain or compressed file chunk by chunk, raising
+        UnicodeDecodeError if no configured encoding fits its first chunk.
+        """
+        with open(filepath, "rb") as file:
+            compression_format = self._detect_compression_format(file, filepath)
+            if compression_format is not None:
+                _, _, opener = COMPRESSION_FORMATS[compression_format]
+                with opener(file, "rb") as stream:
+                    yield from self._decode_chunks(iter(lambda: stream.read(chunk_size), b""), filepath)
+                return
+
+            with self._map_file(file) as buffer:
+                yield from self._decode_chunks(self._split_buffer(buffer, chunk_size), filepath)
+
+    def _read_text(self, filepath: str, chunk_size: int) -> str:
+        """
+        Decode a whole file, raising UnicodeDecodeError if no configured
+        encoding fits.
+
+        A plain file is decoded chunk by chunk from a memory map, so its
+        raw bytes are never held in memory alongside the text; if a chunk
+        fails, decoding starts over with the next encoding, which only
+        re-reads the page cache. Compressed files cannot be rewound and are
+        decoded as in iter_text_file.
+        """
+        with open(filepath, "rb") as file:
+            if self._detect_compression_format(file, filepath) is not None:
+                return "".join(self._iter_text_chunks(filepath, chunk_size))
+
+            with self._map_file(file) as buffer:
+                for encoding in self.config.FILE_ENCODINGS:
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                    parts = []
+                    try:
+                        # Sliced inline: a slice still referenced would keep
+                        # the map from closing
+                        for start in range(0, len(buffer), chunk_size):
+                            parts.append(decoder.decode(buffer[start : start + chunk_size]))
+                        parts.append(decoder.decode(b"", final=True))
+                    except UnicodeDecodeError:
+                        continue
+                    return "".join(parts)
+
+        raise UnicodeDecodeError("unknown", b"", 0, 0, "no configured encoding fits")
+
+    @contextmanager
+    def _map_file(self, file):
+        """
+        Memory-map an open file for sequential reading, as a memoryview.
+        """
+        if os.fstat(file.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as buffer:
+                yield buffer
+
+    @staticmethod
+    def _split_buffer(buffer: memoryview, chunk_size: int) -> Iterator[memoryview]:
+        """Slice a buffer into chunks without copying."""
+        return (buffer[start : start + chunk_size] for start in range(0, len(buffer), chunk_size))
+
+    def _decode_chunks(self, chunks: Iterator, filepath: str) -> Iterator[str]:
+        """
+        Decode byte chunks, picking the encoding from the first one.
+        """
+        first = next(chunks, None)
+        if first is None:
+            return
+        second = next(chunks, None)
+
+        # Try each encoding on the first chunk only; if it is the whole
+        # input, it must decode completely
+        for encoding in self.config.FILE_ENCODINGS:
+            decoder = codecs.getincrementaldecoder(encoding)()
             try:
-                with open(filepath, "r", encoding=encoding) as file:
-                    content = file.read()
-
-                    if not content.strip():
-                        print(f"Warning: File '{filepath}' appears to be empty.")
-                        return ""
-
-                    # Success - return the content
-                    return content
-
-            except PermissionError:
-                print(f"Error: Permission denied reading '{filepath}'")
-                return ""
-            except Exception as e:
-                print(f"Error reading file '{filepath}': {e}")
-                return ""
-        print(f"Error: Could not decode '{filepath}' with any supported encoding.")
-        return ""
+                text = decoder.decode(first, final=second is None)
+            except UnicodeDecodeError:
+                continue
+            break
+        else:
+            raise UnicodeDecodeError(
+                "unknown", bytes(first[:1]), 0, 1, "no configured encoding fits"
+            )
+
+        if text:
+            yield text
+        if second is None:
+            return
+
+        # A final empty chunk flushes the decoder
+        for chunk in itertools.chain((second,), chunks, (None,)):
+            final = chunk is None
+            if final:
+                chunk = b""
+            try:
+                text = decoder.decode(chunk, final=final)
+            except UnicodeDecodeError:
+                # A failed decode leaves the decoder's state untouched, so
+                # the chunk can be decoded again with replacement
+                print(f"Warning: '{filepath}' is not entirely {encoding}; "
+                      f"undecodable bytes after the first chunk were replaced.")
+                decoder.errors = "replace"
+                text = decoder.decode(chunk, final=final)
+            if text:
+                yield text
+
+    def get_compression_format(self, filepath: str) -> Optional[str]:
+        """
+        Identify a gzip, bz2 or xz file by its magic bytes or extension.
+
+        Returns the format name, or None for an uncompressed file.
+        """
+        with open(filepath, "rb") as file:
+            return self._detect_compression_format(file, filepath)
+
+    def _detect_compression_format(self, file, filepath: str) -> Optional[str]:
+        """
+        Sniff the compression format from an open file, leaving it at offset 0.
+        """
+        header = file.read(10)
+        file.seek(0)
+
+        for name, (pattern, _, _) in COMPRESSION_FORMATS.items():
+            if pattern.match(header):
+                return name
+
+        # Fall back to the extension, e.g. for a truncated archive, so the
+        # decompressor reports the problem instead of decoding garbage
+        extension = os.path.splitext(filepath)[1].lower()
+        for name, (_, format_extension, _) in COMPRESSION_FORMATS.items():
+            if extension == format_extension:
+                return name
+        return None
 
     def write_text_file(self, filepath: str, content: str) -> bool:
         """
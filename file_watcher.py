@@ -0,0 +1,148 @@
+"""
+File Watcher Module
+Follows growing text files and keeps their word counts up to date by
+processing only the data appended since the last check.
+"""
+
+import codecs
+import os
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, Optional
+
+from config_module import Config
+from file_manager import FileManager
+from text_processor import TextProcessor
+from word_counter import WordCounter
+
+
+class _TailState:
+    """Read position and decoding state of one watched file."""
+
+    def __init__(self, file_id, encoding: str):
+        self.file_id = file_id
+        self.offset = 0
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self.pending = ""  # trailing word fragment not yet processed
+
+
+class FileWatcher:
+    """
+    Watches files or directories and counts words incrementally.
+
+    Each file's byte offset is remembered, so every poll reads, tokenizes
+    and counts only newly appended data. A file that shrinks or is replaced
+    (log rotation) is followed from its new start; words counted from the
+    old contents are kept. A word at the very end of a file is counted once
+    the whitespace after it has been written. Directory and glob sources
+    are re-expanded on each poll, so new files are picked up as they appear.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[str],
+        file_manager: Optional[FileManager] = None,
+        text_processor: Optional[TextProcessor] = None,
+        word_counter: Optional[WordCounter] = None,
+    ):
+        """Initialize the watcher with the sources to follow."""
+        self.config = Config()
+        self.sources = list(sources)
+        self.file_manager = file_manager or FileManager()
+        self.text_processor = text_processor or TextProcessor()
+        self.word_counter = word_counter or WordCounter()
+        self.word_count = Counter()
+        self._states: Dict[str, _TailState] = {}
+        self._skipped = set()
+
+    def poll(self) -> int:
+        """
+        Process data appended to the watched files since the last poll.
+
+        Returns the number of new words counted.
+        """
+        new_words = 0
+        for filepath in self.file_manager.collect_input_files(self.sources):
+            new_words += self._poll_file(filepath)
+        return new_words
+
+    def run(
+        self,
+        on_update: Callable[[Counter], None],
+        interval: Optional[float] = None,
+        max_updates: Optional[int] = None,
+    ):
+        """
+        Poll the files every interval seconds and call on_update with the
+        current counts whenever new words were counted.
+
+        Runs until interrupted, or until on_update has been called
+        max_updates times.
+        """
+        if interval is None:
+            interval = self.config.WATCH_INTERVAL_SECONDS
+
+        updates = 0
+        while max_updates is None or updates < max_updates:
+            started = time.monotonic()
+            if self.poll():
+                on_update(self.word_count)
+                updates += 1
+
+            elapsed = time.monotonic() - started
+            if max_updates is None or updates < max_updates:
+                time.sleep(max(0.0, interval - elapsed))
+
+    def _poll_file(self, filepath: str) -> int:
+        """Read and count whatever was appended to one file."""
+        if filepath in self._skipped:
+            return 0
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return 0
+
+        state = self._states.get(filepath)
+        if state is None:
+            if self.file_manager.get_compression_format(filepath):
+                print(f"Warning: Cannot follow compressed file '{filepath}', skipping.")
+                self._skipped.add(filepath)
+                return 0
+            state = self._new_state(stat)
+            self._states[filepath] = state
+        elif state.file_id != (stat.st_dev, stat.st_ino) or stat.st_size < state.offset:
+            # Rotated or truncated: start over on the new contents
+            state = self._new_state(stat)
+            self._states[filepath] = state
+
+        if stat.st_size == state.offset:
+            return 0
+
+        chunk_size = self.config.STREAM_CHUNK_SIZE
+        new_words = 0
+        try:
+            with open(filepath, "rb") as file:
+                file.seek(state.offset)
+                remaining = stat.st_size - state.offset
+                while remaining > 0:
+                    data = file.read(min(chunk_size, remaining))
+                    if not data:
+                        break
+                    state.offset += len(data)
+                    remaining -= len(data)
+
+                    complete, state.pending = self.text_processor.split_stream_chunk(
+                        state.pending, state.decoder.decode(data)
+                    )
+                    words = self.text_processor.process_text_fast(complete)
+                    self.word_count.update(words)
+                    new_words += len(words)
+
+        except OSError as e:
+            print(f"Error reading file '{filepath}': {e}")
+        return new_words
+
+    def _new_state(self, stat) -> _TailState:
+        """Create the read state for a file seen for the first time."""
+        return _TailState((stat.st_dev, stat.st_ino), self.config.FILE_ENCODINGS[0])
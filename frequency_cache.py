@@ -0,0 +1,116 @@
+"""
+Frequency Cache Module
+Persistent, content-addressed cache of processed word-frequency tables.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+from config_module import Config
+from disk_cache import DiskUsage, touch
+from frequency_snapshot import FrequencySnapshot
+from text_processor import TOKENIZER_VERSION, TextProcessor
+
+
+class FrequencyCache:
+    """
+    Stores full word-frequency tables on disk, keyed by the decoded text of
+    the source file and every setting that affects processing.
+
+    Entries are written to a temporary file and atomically renamed into
+    place, so several processes can share one cache directory: readers only
+    ever see complete entries, and an entry evicted by another process is
+    simply a cache miss. Each hit refreshes the entry's modification time,
+    and the least recently used entries are evicted once the cache grows
+    past its size limit.
+    """
+
+    ENTRY_SUFFIX = ".wcfs"
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        """Initialize the cache with configuration."""
+        self.config = Config()
+        self.directory = directory or self.config.FREQUENCY_CACHE_DIRECTORY
+        self.max_bytes = max_bytes or self.config.FREQUENCY_CACHE_MAX_BYTES
+        self.disk_usage = DiskUsage(self.directory, self.ENTRY_SUFFIX, self.max_bytes)
+
+    def make_key(self, text: str, text_processor: TextProcessor) -> str:
+        """
+        Build the cache key for a file's decoded text processed by
+        text_processor.
+
+        The text is hashed as already read, so the file is not read again,
+        and the key follows whichever of Config.FILE_ENCODINGS decoded it.
+        """
+        digest = hashlib.sha256()
+        chunk_size = self.config.STREAM_CHUNK_SIZE
+        for start in range(0, len(text), chunk_size):
+            digest.update(text[start : start + chunk_size].encode("utf-8", "surrogatepass"))
+
+        digest.update(f"\0tokenizer={TOKENIZER_VERSION}\0".encode("utf-8"))
+        digest.update(f"min_word_length={text_processor.min_word_length}\0".encode("utf-8"))
+        digest.update("\0".join(sorted(text_processor.stop_words)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[FrequencySnapshot]:
+        """
+        Return the cached frequency table for key, or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        try:
+            snapshot = FrequencySnapshot.from_bytes(data)
+        except ValueError:
+            # A damaged entry is dropped and recomputed
+            self._remove(path)
+            return None
+
+        touch(path)
+        return snapshot
+
+    def put(self, key: str, snapshot: FrequencySnapshot) -> bool:
+        """
+        Store a frequency table under key, then enforce the size limit.
+        """
+        path = self._entry_path(key)
+        temp_path = None
+        data = snapshot.to_bytes()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Warning: Could not write frequency cache entry: {e}")
+            if temp_path:
+                self._remove(temp_path)
+            return False
+
+        self.disk_usage.add(len(data))
+        return True
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits its size limit.
+        """
+        self.disk_usage.evict()
+
+    def _entry_path(self, key: str) -> str:
+        """Path of the entry for key, fanned out by its first two characters."""
+        return os.path.join(self.directory, key[:2], key + self.ENTRY_SUFFIX)
+
+    @staticmethod
+    def _remove(path: str):
+        """Delete a file, ignoring files another process already removed."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,190 @@
+"""
+Frequency Snapshot Module
+Compact, versioned word-frequency tables that can be saved, loaded and merged.
+"""
+
+import struct
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from vocabulary import top_indices
+
+
+class FrequencySnapshot:
+    """
+    An immutable word-frequency table with a sorted vocabulary.
+
+    Snapshots from different shards, machines or days can be merged in any
+    order and grouping and always give the same result, so raw text only has
+    to be tokenized once.
+
+    Binary layout (little-endian):
+    - header: magic, format version, reserved, vocabulary size, CRC32 of body
+    - body: one uint64 count per word, then the words as NUL-separated UTF-8
+    """
+
+    MAGIC = b"WCFS"
+    FORMAT_VERSION = 1
+    _HEADER = struct.Struct("<4sHHQI")
+
+    def __init__(self, words: List[str], counts: np.ndarray):
+        """
+        Wrap an already sorted, duplicate-free vocabulary and its counts.
+        Use from_counts to build a snapshot from an arbitrary table.
+        """
+        if len(words) != len(counts):
+            raise ValueError("words and counts must have the same length")
+
+        self.words = words
+        self.counts = np.asarray(counts, dtype=np.uint64)
+
+    @classmethod
+    def from_counts(cls, word_count: Dict[str, int]) -> "FrequencySnapshot":
+        """
+        Build a snapshot from a word -> count mapping.
+        """
+        words = sorted(word_count)
+        counts = np.fromiter(
+            (word_count[word] for word in words), dtype=np.uint64, count=len(words)
+        )
+        return cls(words, counts)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrequencySnapshot):
+            return NotImplemented
+        return self.words == other.words and np.array_equal(self.counts, other.counts)
+
+    @property
+    def total(self) -> int:
+        """
+        Total number of words counted.
+        """
+        return int(self.counts.sum())
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Return the full table as a word -> count mapping.
+        """
+        return dict(zip(self.words, self.counts.tolist()))
+
+    def top_words(self, max_words: int = 50) -> Dict[str, int]:
+        """
+        Return the top N words, ordered by count.
+
+        Ties are broken alphabetically, so the result does not depend on the
+        order in which snapshots were merged.
+        """
+        return {
+            self.words[i]: int(self.counts[i])
+            for i in top_indices(self.counts, max_words)
+        }
+
+    def merge(self, other: "FrequencySnapshot") -> "FrequencySnapshot":
+        """
+        Combine two snapshots by adding their counts.
+        """
+        left_words, right_words = self.words, other.words
+        left_counts, right_counts = self.counts.tolist(), other.counts.tolist()
+
+        words, counts = [], []
+        i = j = 0
+        while i < len(left_words) and j < len(right_words):
+            if left_words[i] == right_words[j]:
+                words.append(left_words[i])
+                counts.append(left_counts[i] + right_counts[j])
+                i += 1
+                j += 1
+            elif left_words[i] < right_words[j]:
+                words.append(left_words[i])
+                counts.append(left_counts[i])
+                i += 1
+            else:
+                words.append(right_words[j])
+                counts.append(right_counts[j])
+                j += 1
+
+        words.extend(left_words[i:])
+        counts.extend(left_counts[i:])
+        words.extend(right_words[j:])
+        counts.extend(right_counts[j:])
+        return FrequencySnapshot(words, np.array(counts, dtype=np.uint64))
+
+    __add__ = merge
+
+    @classmethod
+    def merge_all(cls, snapshots: Iterable["FrequencySnapshot"]) -> "FrequencySnapshot":
+        """
+        Merge any number of snapshots into one.
+        """
+        result = cls([], np.zeros(0, dtype=np.uint64))
+        for snapshot in snapshots:
+            result = result.merge(snapshot)
+        return result
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the snapshot to the binary format.
+        """
+        if any("\0" in word for word in self.words):
+            raise ValueError("words must not contain NUL characters")
+
+        body = self.counts.astype("<u8").tobytes() + "\0".join(self.words).encode("utf-8")
+        header = self._HEADER.pack(
+            self.MAGIC, self.FORMAT_VERSION, 0, len(self.words), zlib.crc32(body)
+        )
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FrequencySnapshot":
+        """
+        Deserialize a snapshot, validating its header and checksum.
+        """
+        if len(data) < cls._HEADER.size:
+            raise ValueError("data is too short to be a frequency snapshot")
+
+        magic, version, _, size, checksum = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("data is not a frequency snapshot")
+        if version != cls.FORMAT_VERSION:
+            raise ValueError(f"unsupported frequency snapshot version {version}")
+
+        body = memoryview(data)[cls._HEADER.size :]
+        if zlib.crc32(body) != checksum:
+            raise ValueError("frequency snapshot is corrupted (checksum mismatch)")
+
+        counts_size = size * 8
+        counts = np.frombuffer(body[:counts_size], dtype="<u8").astype(np.uint64)
+        vocabulary = bytes(body[counts_size:]).decode("utf-8")
+        words = vocabulary.split("\0") if size else []
+        if len(words) != size:
+            raise ValueError("frequency snapshot vocabulary size does not match header")
+        return cls(words, counts)
+
+    def save(self, filepath: str) -> bool:
+        """
+        Save the snapshot to a file.
+        """
+        try:
+            with open(filepath, "wb") as file:
+                file.write(self.to_bytes())
+            return True
+        except Exception as e:
+            print(f"Error saving frequency snapshot '{filepath}': {e}")
+            return False
+
+    @classmethod
+    def load(cls, filepath: str) -> Optional["FrequencySnapshot"]:
+        """
+        Load a snapshot from a file.
+        """
+        try:
+            with open(filepath, "rb") as file:
+                return cls.from_bytes(file.read())
+        except Exception as e:
+            print(f"Error loading frequency snapshot '{filepath}': {e}")
+            return None
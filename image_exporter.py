@@ -0,0 +1,113 @@
+"""
+Image Exporter Module
+Writes one rendered image to several formats and thumbnail sizes at once.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from config_module import Config
+
+
+class ImageExporter:
+    """
+    Encodes a single rendered image into many output files in parallel.
+
+    Every output (one per format, plus one per thumbnail size) is resized
+    and encoded on its own thread; PIL releases the GIL while it resizes
+    and encodes, so the outputs are produced concurrently. The image is
+    never re-rendered.
+    """
+
+    # format name: (file extension, PIL format, lossy)
+    FORMATS = {
+        "png": (".png", "PNG", False),
+        "jpeg": (".jpg", "JPEG", True),
+        "webp": (".webp", "WEBP", True),
+    }
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the exporter with configuration."""
+        self.config = Config()
+        self.max_workers = max_workers or self.config.EXPORT_WORKERS or os.cpu_count() or 1
+
+    def export(
+        self,
+        image: Union[Image.Image, np.ndarray],
+        base_path: str,
+        formats: Optional[Sequence[str]] = None,
+        thumbnail_sizes: Optional[Sequence[Tuple[int, int]]] = None,
+        primary_path: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Write image as base_path plus each format's extension, and a
+        thumbnail named base_path_WxH for each size (fitted inside it,
+        keeping the aspect ratio) in Config.EXPORT_THUMBNAIL_FORMAT.
+        If primary_path is given, the first format is written to exactly
+        that path instead.
+
+        Returns one report per output, in that order, holding 'path',
+        'format', 'size', 'bytes', 'seconds', 'success' and 'error'.
+        """
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        if formats is None:
+            formats = self.config.EXPORT_FORMATS
+        if thumbnail_sizes is None:
+            thumbnail_sizes = self.config.EXPORT_THUMBNAIL_SIZES
+
+        outputs = [(base_path + self.FORMATS[name][0], name, None) for name in formats]
+        if primary_path is not None and outputs:
+            outputs[0] = (primary_path, outputs[0][1], None)
+        thumbnail_format = self.config.EXPORT_THUMBNAIL_FORMAT
+        for width, height in thumbnail_sizes:
+            path = f"{base_path}_{width}x{height}{self.FORMATS[thumbnail_format][0]}"
+            outputs.append((path, thumbnail_format, (width, height)))
+
+        if not outputs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(outputs))) as executor:
+            return list(executor.map(lambda output: self._write(image, *output), outputs))
+
+    @classmethod
+    def format_for_path(cls, path: str) -> Optional[str]:
+        """
+        Return the format name matching path's extension, or None.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".jpeg":
+            return "jpeg"
+        for name, (format_extension, _, _) in cls.FORMATS.items():
+            if extension == format_extension:
+                return name
+        return None
+
+    def _write(self, image: Image.Image, path: str, format_name: str,
+               thumbnail_size: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+        """Resize (for thumbnails), encode and write one output, timing it."""
+        _, pil_format, lossy = self.FORMATS[format_name]
+        options = {"quality": self.config.EXPORT_QUALITY} if lossy else {}
+        started = time.perf_counter()
+        try:
+            if thumbnail_size is not None:
+                image = image.copy()
+                image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+            if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            image.save(path, pil_format, **options)
+            return {
+                "path": path, "format": format_name, "size": image.size,
+                "bytes": os.path.getsize(path), "seconds": time.perf_counter() - started,
+                "success": True, "error": None,
+            }
+        except Exception as e:
+            return {
+                "path": path, "format": format_name, "size": image.size,
+                "bytes": 0, "seconds": time.perf_counter() - started,
+                "success": False, "error": f"{type(e).__name__}: {e}",
+            }
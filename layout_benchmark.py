@@ -0,0 +1,91 @@
+"""
+Layout Benchmark
+Times the library and native layout engines on synthetic word clouds of
+different sizes, with and without the fill-canvas settings.
+
+Usage: python3 layout_benchmark.py [--repeat N] [--mask PATH]
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Dict, Optional
+
+from wordcloud import WordCloud
+
+from config_module import Config
+from mask_cache import MaskCache
+from wordcloud_visualizer import NativeLayoutEngine
+
+WORD_COUNTS = (50, 200, 2000)
+
+
+def make_frequencies(count: int, seed: int = 0) -> Dict[str, int]:
+    """Make count distinct pseudo-words with Zipf-distributed frequencies."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))))
+    return {word: max(1, int(10000 / rank)) for rank, word in enumerate(sorted(words), start=1)}
+
+
+def make_settings(fill_canvas: bool) -> Dict:
+    """WordCloud settings as WordCloudVisualizer would use them."""
+    settings = dict(Config.WORDCLOUD_SETTINGS)
+    settings.pop("background_color", None)
+    if fill_canvas:
+        settings.update(relative_scaling=1, min_font_size=5, max_font_size=None, margin=0, prefer_horizontal=0.5)
+    return settings
+
+
+def time_engine(engine: str, frequencies: Dict[str, int], settings: Dict, mask, repeat: int) -> tuple:
+    """Return (best seconds, words placed) for one engine."""
+    best, placed = float("inf"), 0
+    for _ in range(repeat):
+        wordcloud = WordCloud(
+            width=Config.DEFAULT_WIDTH, height=Config.DEFAULT_HEIGHT,
+            mask=mask, max_words=len(frequencies), **settings
+        )
+        started = time.perf_counter()
+        if engine == "native":
+            NativeLayoutEngine().generate(wordcloud, frequencies)
+        else:
+            wordcloud.generate_from_frequencies(frequencies)
+        best = min(best, time.perf_counter() - started)
+        placed = len(wordcloud.layout_)
+    return best, placed
+
+
+def run(repeat: int, mask_path: Optional[str]):
+    """Print a timing table for every word count and setting."""
+    mask = None
+    if mask_path:
+        mask = MaskCache().load(mask_path, (Config.DEFAULT_WIDTH, Config.DEFAULT_HEIGHT))
+
+    print(f"{'words':>6} {'fill':>5} {'wordcloud':>16} {'native':>16} {'speedup':>8}")
+    for count in WORD_COUNTS:
+        frequencies = make_frequencies(count)
+        for fill_canvas in (False, True):
+            settings = make_settings(fill_canvas)
+            library_time, library_placed = time_engine("wordcloud", frequencies, settings, mask, repeat)
+            native_time, native_placed = time_engine("native", frequencies, settings, mask, repeat)
+            print(
+                f"{count:>6} {'yes' if fill_canvas else 'no':>5} "
+                f"{library_time:>8.3f}s ({library_placed:>4}) "
+                f"{native_time:>8.3f}s ({native_placed:>4}) "
+                f"{library_time / native_time:>7.1f}x"
+            )
+
+
+def main():
+    """Entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description="Compare word cloud layout engines")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is kept")
+    parser.add_argument("--mask", help="Optional mask image to lay out into")
+    args = parser.parse_args()
+    run(args.repeat, args.mask)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Layout Cache Module
+Keeps computed word cloud layouts in memory and on disk so a cloud can be
+recolored or re-exported without running word placement again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+from wordcloud import WordCloud
+
+from config_module import Config
+from disk_cache import DiskUsage, touch
+
+# Bumped whenever the document layout or the placement inputs change
+LAYOUT_FORMAT_VERSION = 1
+
+
+def layout_to_document(wordcloud: WordCloud) -> Dict[str, Any]:
+    """
+    Describe a generated word cloud's layout as a JSON-serializable dict.
+
+    Colors are left out: a layout is shared by every color scheme.
+    """
+    return {
+        "version": LAYOUT_FORMAT_VERSION,
+        "words": [[word, frequency] for word, frequency in wordcloud.words_.items()],
+        "layout": [
+            [word, frequency, font_size, [int(position[0]), int(position[1])],
+             None if orientation is None else int(orientation)]
+            for (word, frequency), font_size, position, orientation, _ in wordcloud.layout_
+        ],
+    }
+
+
+def restore_layout(wordcloud: WordCloud, document: Dict[str, Any]) -> WordCloud:
+    """
+    Give an ungenerated word cloud the layout stored in document.
+
+    Words are colored with the word cloud's own color function.
+    """
+    wordcloud.words_ = {word: frequency for word, frequency in document["words"]}
+    wordcloud.layout_ = [
+        ((word, frequency), font_size, tuple(position),
+         None if orientation is None else Image.Transpose(orientation), None)
+        for word, frequency, font_size, position, orientation in document["layout"]
+    ]
+    return wordcloud.recolor()
+
+
+class LayoutCache:
+    """
+    Remembers word cloud layouts by everything that affects placement.
+
+    The key covers the frequencies, canvas size, mask and layout settings,
+    but not the color scheme or background, so changing only the colors
+    finds the layout again. Layouts are kept in a small in-memory LRU.
+    With persist (Config.USE_LAYOUT_DISK_CACHE, off by default) they are
+    also written to disk as JSON, so they survive restarts; the least
+    recently used files are deleted once they exceed max_bytes.
+    """
+
+    ENTRY_SUFFIX = ".json"
+
+    def __init__(self, directory: Optional[str] = None, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None, persist: Optional[bool] = None):
+        """Initialize the cache with configuration."""
+        self.config = Config()
+        self.directory = directory or self.config.LAYOUT_CACHE_DIRECTORY
+        self.max_entries = max_entries or self.config.LAYOUT_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or self.config.LAYOUT_CACHE_MAX_BYTES
+        self.persist = self.config.USE_LAYOUT_DISK_CACHE if persist is None else persist
+        self.disk_usage = DiskUsage(self.directory, self.ENTRY_SUFFIX, self.max_bytes)
+        self._memory = OrderedDict()
+
+    def make_key(
+        self,
+        word_count: Dict[str, int],
+        size: Tuple[int, int],
+        mask_key: Optional[str],
+        max_words: int,
+        settings: Dict[str, Any],
+    ) -> str:
+        """
+        Build the cache key for laying out word_count with the given options.
+
+        mask_key identifies the prepared mask (see MaskCache.make_key), or is
+        None for a rectangular canvas.
+        """
+        description = json.dumps(
+            {
+                "version": LAYOUT_FORMAT_VERSION,
+                # Order matters: it breaks ties between equal frequencies
+                "frequencies": list(word_count.items()),
+                "size": list(size),
+                "mask": mask_key,
+                "max_words": max_words,
+                "settings": settings,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the layout document stored under key, or None on a miss.
+        """
+        document = self._memory.get(key)
+        if document is not None:
+            self._memory.move_to_end(key)
+            return document
+
+        if not self.persist:
+            return None
+        document = self._load_from_disk(key)
+        if document is not None:
+            self._remember(key, document)
+        return document
+
+    def put(self, key: str, document: Dict[str, Any]):
+        """
+        Store a layout document under key.
+        """
+        self._remember(key, document)
+        if self.persist:
+            self._save_to_disk(key, document)
+
+    def clear(self):
+        """
+        Forget the layouts held in memory.
+        """
+        self._memory.clear()
+
+    def evict(self):
+        """
+        Remove least recently used layouts from disk until they fit in max_bytes.
+        """
+        self.disk_usage.evict()
+
+    def _remember(self, key: str, document: Dict[str, Any]):
+        """Keep a document in the in-memory LRU."""
+        self._memory[key] = document
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        """Path of the on-disk entry for key."""
+        return os.path.join(self.directory, key + self.ENTRY_SUFFIX)
+
+    def _load_from_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a layout from disk, or None if it is missing, unreadable or outdated."""
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                document = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(document, dict) or document.get("version") != LAYOUT_FORMAT_VERSION:
+            return None
+        touch(path)  # Recently used, so evicted last
+        return document
+
+    def _save_to_disk(self, key: str, document: Dict[str, Any]):
+        """Write a layout to disk atomically."""
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(document, file, ensure_ascii=False, separators=(",", ":"))
+                size_bytes = file.tell()
+            os.replace(temp_path, self._disk_path(key))
+        except OSError as e:
+            print(f"Warning: Could not cache layout on disk: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self.disk_usage.add(size_bytes)
@@ -0,0 +1,296 @@
+"""
+Layout Document Module
+A finished word cloud layout that can be saved, loaded and drawn again as
+an image or SVG at any scale and in any colors, without the source text
+or the layout engine.
+"""
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from wordcloud import WordCloud
+from wordcloud.wordcloud import FONT_PATH
+
+from color_engine import ColorEngine
+from config_module import Config
+
+
+class LayoutDocument:
+    """
+    The canvas size, background color and, for every placed word, its
+    frequency, font size, position, orientation and color.
+
+    Layouts use the WordCloud layout_ convention: positions are (row,
+    column) of the word's top-left corner on the layout canvas, and rotated
+    words are turned 90 degrees counter-clockwise. Like WordCloud.to_image,
+    drawing multiplies the layout by the word cloud's scale. Documents are
+    drawn with the font the layout was made with; if that file does not
+    exist where the document is drawn, pass the same font as font_path.
+
+    Binary layout (little-endian):
+    - header: magic, format version, reserved, canvas width, canvas height,
+      word count, scale (float64), CRC32 of body
+    - body, zlib-compressed: one record per word (float32 frequency, uint16
+      font size, uint32 row, uint32 column, uint8 rotated), then the
+      background color, the font path, the words and the colors as
+      NUL-separated UTF-8
+    """
+
+    MAGIC = b"WCLD"
+    FORMAT_VERSION = 1
+    _HEADER = struct.Struct("<4sHHIIIdI")
+    _RECORD = np.dtype(
+        [("frequency", "<f4"), ("font_size", "<u2"), ("row", "<u4"), ("column", "<u4"), ("rotated", "u1")]
+    )
+
+    def __init__(self, width: int, height: int, layout: list, background_color: str = "white",
+                 font_path: Optional[str] = None, scale: float = 1.0):
+        """
+        Wrap a WordCloud-style layout_ for a canvas of width x height,
+        made with font_path (the library default if None) and drawn at scale.
+        """
+        self.width = width
+        self.height = height
+        self.layout = layout
+        self.background_color = background_color
+        self.font_path = font_path or FONT_PATH
+        self.scale = scale
+
+    @classmethod
+    def from_word_cloud(cls, wordcloud: WordCloud) -> "LayoutDocument":
+        """
+        Capture the layout of a generated word cloud.
+        """
+        if wordcloud.mask is not None:
+            height, width = wordcloud.mask.shape[:2]
+        else:
+            width, height = wordcloud.width, wordcloud.height
+        layout = [
+            ((word, float(freq)), int(font_size), (int(position[0]), int(position[1])), orientation, color)
+            for (word, freq), font_size, position, orientation, color in wordcloud.layout_
+        ]
+        return cls(width, height, layout, wordcloud.background_color, wordcloud.font_path, wordcloud.scale)
+
+    def __len__(self) -> int:
+        return len(self.layout)
+
+    def to_word_cloud(self, font_path: Optional[str] = None) -> WordCloud:
+        """
+        Return a generated WordCloud holding this layout, so the library's
+        to_image, to_file, to_array and recolor can be used on it.
+        """
+        wordcloud = WordCloud(
+            width=self.width, height=self.height, background_color=self.background_color,
+            font_path=self._font_path(font_path), scale=self.scale,
+        )
+        wordcloud.words_ = {word: freq for (word, freq), *_ in self.layout}
+        wordcloud.layout_ = list(self.layout)
+        return wordcloud
+
+    def render(self, scale: float = 1.0, color_scheme: Optional[str] = None,
+               background_color: Optional[str] = None, font_path: Optional[str] = None) -> Image.Image:
+        """
+        Draw the layout as an image, scaled by scale on top of the
+        document's own scale, optionally recolored with one of
+        Config.COLOR_SCHEMES and on another background.
+        """
+        font_path = self._font_path(font_path)
+        scale *= self.scale
+        image = Image.new(
+            "RGB", (int(self.width * scale), int(self.height * scale)), background_color or self.background_color
+        )
+        draw = ImageDraw.Draw(image)
+        fonts = {}
+        for ((word, _), font_size, position, orientation, _), color in zip(self.layout, self._colors(color_scheme)):
+            size = int(font_size * scale)
+            if size < 1:
+                continue
+            if (size, orientation) not in fonts:
+                fonts[size, orientation] = ImageFont.TransposedFont(
+                    ImageFont.truetype(font_path, size), orientation=orientation
+                )
+            draw.text((int(position[1] * scale), int(position[0] * scale)), word,
+                      fill=color, font=fonts[size, orientation])
+        return image
+
+    def to_svg(self, scale: float = 1.0, color_scheme: Optional[str] = None,
+               background_color: Optional[str] = None, font_path: Optional[str] = None) -> str:
+        """
+        Draw the layout as an SVG document, scaled by scale on top of the
+        document's own scale, optionally recolored and on another background.
+
+        Text is positioned with the font's metrics and refers to the font
+        by family name; it is not embedded.
+        """
+        font_path = self._font_path(font_path)
+        scale *= self.scale
+        family = ImageFont.truetype(font_path, 10).getname()[0]
+        width, height = int(self.width * scale), int(self.height * scale)
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">',
+            f'<rect width="100%" height="100%" fill={quoteattr(background_color or self.background_color)}/>',
+            f'<g font-family={quoteattr(family)}>',
+        ]
+        fonts = {}
+        for ((word, _), font_size, position, orientation, _), color in zip(self.layout, self._colors(color_scheme)):
+            size = int(font_size * scale)
+            if size < 1:
+                continue
+            if size not in fonts:
+                fonts[size] = ImageFont.truetype(font_path, size)
+            font = fonts[size]
+            ascent = font.getmetrics()[0]
+            row, column = int(position[0] * scale), int(position[1] * scale)
+            if orientation is None:
+                placement = f'x="{column}" y="{row + ascent}"'
+            else:
+                # Turned counter-clockwise about the top-left corner of the unrotated text
+                text_width = ImageFont.TransposedFont(font).getbbox(word)[2]
+                placement = f'y="{ascent}" transform="translate({column},{row + text_width}) rotate(-90)"'
+            lines.append(
+                f'<text {placement} font-size="{size}" fill={quoteattr(color or "black")}>{escape(word)}</text>'
+            )
+        lines.append("</g>")
+        lines.append("</svg>")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the document as a JSON-serializable dict.
+        """
+        return {
+            "version": self.FORMAT_VERSION,
+            "width": self.width,
+            "height": self.height,
+            "background_color": self.background_color,
+            "font_path": self.font_path,
+            "scale": self.scale,
+            "words": [
+                [word, freq, font_size, position[0], position[1], orientation is not None, color]
+                for (word, freq), font_size, position, orientation, color in self.layout
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, document: Dict[str, Any]) -> "LayoutDocument":
+        """
+        Build a document from the dict form, validating its version.
+        """
+        if document.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"unsupported layout document version {document.get('version')}")
+        layout = [
+            ((word, freq), font_size, (row, column), Image.ROTATE_90 if rotated else None, color)
+            for word, freq, font_size, row, column, rotated, color in document["words"]
+        ]
+        return cls(document["width"], document["height"], layout, document["background_color"],
+                   document["font_path"], document["scale"])
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the document to the compact binary format.
+        """
+        strings = [self.background_color, self.font_path] + [word for (word, _), *_ in self.layout]
+        strings += [entry[4] or "" for entry in self.layout]
+        if any("\0" in string for string in strings):
+            raise ValueError("words and colors must not contain NUL characters")
+
+        records = np.array(
+            [(freq, font_size, position[0], position[1], orientation is not None)
+             for (_, freq), font_size, position, orientation, _ in self.layout],
+            dtype=self._RECORD,
+        )
+
+        body = zlib.compress(records.tobytes() + "\0".join(strings).encode("utf-8"))
+        header = self._HEADER.pack(
+            self.MAGIC, self.FORMAT_VERSION, 0, self.width, self.height, len(self.layout), self.scale,
+            zlib.crc32(body),
+        )
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LayoutDocument":
+        """
+        Deserialize a document, validating its header and checksum.
+        """
+        if len(data) < cls._HEADER.size:
+            raise ValueError("data is too short to be a layout document")
+
+        magic, version, _, width, height, size, scale, checksum = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("data is not a layout document")
+        if version != cls.FORMAT_VERSION:
+            raise ValueError(f"unsupported layout document version {version}")
+
+        body = memoryview(data)[cls._HEADER.size :]
+        if zlib.crc32(body) != checksum:
+            raise ValueError("layout document is corrupted (checksum mismatch)")
+        body = zlib.decompress(body)
+
+        records_size = size * cls._RECORD.itemsize
+        records = np.frombuffer(body[:records_size], dtype=cls._RECORD)
+        strings = body[records_size:].decode("utf-8").split("\0")
+        if len(strings) != 2 + 2 * size:
+            raise ValueError("layout document word count does not match header")
+
+        words, colors = strings[2 : size + 2], strings[size + 2 :]
+        layout = [
+            ((word, float(record["frequency"])), int(record["font_size"]),
+             (int(record["row"]), int(record["column"])),
+             Image.ROTATE_90 if record["rotated"] else None, color or None)
+            for word, record, color in zip(words, records, colors)
+        ]
+        return cls(width, height, layout, strings[0], strings[1], scale)
+
+    def save(self, filepath: str) -> bool:
+        """
+        Save the document to a file: JSON if the name ends in .json,
+        otherwise the binary format.
+        """
+        try:
+            if filepath.lower().endswith(".json"):
+                with open(filepath, "w", encoding="utf-8") as file:
+                    json.dump(self.to_dict(), file, ensure_ascii=False, separators=(",", ":"))
+            else:
+                with open(filepath, "wb") as file:
+                    file.write(self.to_bytes())
+            return True
+        except Exception as e:
+            print(f"Error saving layout document '{filepath}': {e}")
+            return False
+
+    @classmethod
+    def load(cls, filepath: str) -> Optional["LayoutDocument"]:
+        """
+        Load a document saved by save.
+        """
+        try:
+            if filepath.lower().endswith(".json"):
+                with open(filepath, "r", encoding="utf-8") as file:
+                    return cls.from_dict(json.load(file))
+            with open(filepath, "rb") as file:
+                return cls.from_bytes(file.read())
+        except Exception as e:
+            print(f"Error loading layout document '{filepath}': {e}")
+            return None
+
+    def _font_path(self, font_path: Optional[str]) -> str:
+        """font_path if given, else the document's font, else the library default."""
+        if font_path:
+            return font_path
+        if os.path.exists(self.font_path):
+            return self.font_path
+        print(f"Warning: font '{self.font_path}' not found, drawing with the default font")
+        return FONT_PATH
+
+    def _colors(self, color_scheme: Optional[str]) -> List[Optional[str]]:
+        """The stored colors, or new ones from color_scheme."""
+        if color_scheme is None:
+            return [entry[4] for entry in self.layout]
+        return ColorEngine(Config.WORDCLOUD_SETTINGS.get("random_state")).assign_colors(self.layout, color_scheme)
@@ -0,0 +1,145 @@
+"""
+Mask Cache Module
+Loads shape masks, fits them to the canvas and caches the prepared arrays
+in memory and on disk.
+"""
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from config_module import Config
+from disk_cache import DiskUsage, touch
+
+
+class MaskCache:
+    """
+    Prepares binarized word cloud masks and remembers them.
+
+    A prepared mask is the image converted to grayscale, scaled to fit the
+    canvas with its aspect ratio kept, padded with masked-out (white) space
+    and thresholded to 0/255 with NumPy. Results are keyed by the image's
+    path, modification time and the target canvas size, so an edited image
+    is picked up again while repeated renders of the same shape reuse the
+    prepared array. With persist (Config.USE_MASK_DISK_CACHE, off by
+    default) prepared masks are also saved to disk, where the least
+    recently used are deleted once they exceed max_bytes.
+    """
+
+    THRESHOLD = 128
+    ENTRY_SUFFIX = ".npy"
+
+    def __init__(self, directory: Optional[str] = None, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None, persist: Optional[bool] = None):
+        """Initialize the cache with configuration."""
+        self.config = Config()
+        self.directory = directory or self.config.MASK_CACHE_DIRECTORY
+        self.max_entries = max_entries or self.config.MASK_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or self.config.MASK_CACHE_MAX_BYTES
+        self.persist = self.config.USE_MASK_DISK_CACHE if persist is None else persist
+        self.disk_usage = DiskUsage(self.directory, self.ENTRY_SUFFIX, self.max_bytes)
+        self._memory = OrderedDict()
+
+    def load(self, mask_image_path: str, size: Tuple[int, int]) -> np.ndarray:
+        """
+        Return the prepared mask for an image at size (width, height).
+
+        Raises OSError if the image cannot be read.
+        """
+        key = self.make_key(mask_image_path, size)
+
+        mask = self._memory.get(key)
+        if mask is not None:
+            self._memory.move_to_end(key)
+            return mask
+
+        mask = self._load_from_disk(key) if self.persist else None
+        if mask is None:
+            mask = self.prepare(mask_image_path, size)
+            if self.persist:
+                self._save_to_disk(key, mask)
+
+        mask.flags.writeable = False
+        self._memory[key] = mask
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+        return mask
+
+    def prepare(self, mask_image_path: str, size: Tuple[int, int]) -> np.ndarray:
+        """
+        Load an image and turn it into a binary mask of the given size.
+        """
+        width, height = size
+        with Image.open(mask_image_path) as image:
+            image = image.convert("L")  # Grayscale
+
+        # Fit inside the canvas, keeping the shape's proportions
+        scale = min(width / image.width, height / image.height)
+        fitted_size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(fitted_size, Image.Resampling.LANCZOS)
+
+        # Everything outside the fitted image is masked out
+        canvas = np.full((height, width), 255, dtype=np.uint8)
+        top = (height - fitted_size[1]) // 2
+        left = (width - fitted_size[0]) // 2
+        pixels = np.asarray(image)
+        canvas[top : top + fitted_size[1], left : left + fitted_size[0]] = np.where(
+            pixels > self.THRESHOLD, 255, 0
+        )
+        return canvas
+
+    def clear(self):
+        """
+        Forget the masks held in memory.
+        """
+        self._memory.clear()
+
+    def evict(self):
+        """
+        Remove least recently used masks from disk until they fit in max_bytes.
+        """
+        self.disk_usage.evict()
+
+    def make_key(self, mask_image_path: str, size: Tuple[int, int]) -> str:
+        """Key a mask by path, modification time and target size."""
+        path = os.path.abspath(mask_image_path)
+        mtime = os.stat(path).st_mtime_ns
+        return f"{path}|{mtime}|{size[0]}x{size[1]}"
+
+    def _disk_path(self, key: str) -> str:
+        """Path of the on-disk entry for key."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + self.ENTRY_SUFFIX)
+
+    def _load_from_disk(self, key: str) -> Optional[np.ndarray]:
+        """Read a prepared mask from disk, or None if it is missing or unreadable."""
+        path = self._disk_path(key)
+        try:
+            mask = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+
+        touch(path)  # Recently used, so evicted last
+        return mask
+
+    def _save_to_disk(self, key: str, mask: np.ndarray):
+        """Write a prepared mask to disk atomically."""
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, mask, allow_pickle=False)
+                size_bytes = file.tell()
+            os.replace(temp_path, self._disk_path(key))
+        except OSError as e:
+            print(f"Warning: Could not cache mask on disk: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self.disk_usage.add(size_bytes)
@@ -0,0 +1,116 @@
+"""
+Parallel Processor Module
+Splits large texts into shards and tokenizes and counts them across a process pool.
+"""
+
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from config_module import Config
+from text_processor import TextProcessor
+from word_counter import WordCounter
+
+_WHITESPACE = re.compile(r"\s")
+
+# Per-worker text processor, configured once by _init_worker
+_worker_processor = None
+
+
+def _init_worker(stop_words, min_word_length):
+    """Set up the text processor used by a worker process."""
+    global _worker_processor
+    _worker_processor = TextProcessor()
+    _worker_processor.stop_words = stop_words
+    _worker_processor.min_word_length = min_word_length
+
+
+def _count_shard(shard: str) -> Counter:
+    """Tokenize and count a single shard inside a worker process."""
+    return Counter(_worker_processor.process_text_fast(shard))
+
+
+class ParallelProcessor:
+    """
+    Map-reduce text processing over a pool of worker processes.
+
+    The text is split into shards at whitespace, each shard is tokenized and
+    counted in a worker, and the partial counts are merged in shard order.
+    Because words are merged in the order they first appear, the result is
+    identical to processing the whole text serially.
+    """
+
+    def __init__(
+        self,
+        text_processor: Optional[TextProcessor] = None,
+        workers: Optional[int] = None,
+    ):
+        """Initialize the processor with configuration."""
+        self.config = Config()
+        self.text_processor = text_processor or TextProcessor()
+        self.word_counter = WordCounter()
+        self.workers = workers or self.config.PARALLEL_WORKERS or os.cpu_count() or 1
+        self.shard_size = self.config.PARALLEL_SHARD_SIZE
+
+    def should_use_parallel(self, text: str) -> bool:
+        """
+        Check whether text is large enough to be worth a process pool.
+        """
+        return self.workers > 1 and len(text) >= self.config.PARALLEL_MIN_TEXT_SIZE
+
+    def split_text(self, text: str, shard_size: Optional[int] = None) -> List[str]:
+        """
+        Split text into shards of roughly shard_size characters.
+
+        Every shard except the last ends just after a whitespace character,
+        so no word is cut in two.
+        """
+        if shard_size is None:
+            shard_size = self.shard_size
+
+        shards = []
+        start = 0
+        while start < len(text):
+            target = start + shard_size
+            if target >= len(text):
+                shards.append(text[start:])
+                break
+
+            match = _WHITESPACE.search(text, target)
+            end = match.end() if match else len(text)
+            shards.append(text[start:end])
+            start = end
+        return shards
+
+    def count_words(self, text: str) -> Counter:
+        """
+        Tokenize and count the full vocabulary of text in parallel.
+        """
+        if not text or not text.strip():
+            return Counter()
+
+        shards = self.split_text(text)
+        if len(shards) == 1 or self.workers == 1:
+            return Counter(self.text_processor.process_text_fast(text))
+
+        word_count = Counter()
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(shards)),
+            initializer=_init_worker,
+            initargs=(
+                self.text_processor.stop_words,
+                self.text_processor.min_word_length,
+            ),
+        ) as executor:
+            # map() yields in shard order, which keeps first-seen word order
+            for partial_count in executor.map(_count_shard, shards):
+                word_count.update(partial_count)
+        return word_count
+
+    def count_word_frequencies(self, text: str, max_words: int = 50) -> Dict[str, int]:
+        """
+        Count word frequencies in parallel and return the top N words.
+        """
+        return self.word_counter.select_top_words(self.count_words(text), max_words)
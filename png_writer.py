@@ -0,0 +1,94 @@
+"""
+PNG Writer Module
+Streams an image into a PNG file a band of rows at a time, so images far
+larger than memory can be written.
+"""
+
+import struct
+import zlib
+from typing import BinaryIO, Optional
+
+import numpy as np
+
+from config_module import Config
+
+
+class PngStreamWriter:
+    """
+    Writes an 8-bit PNG whose rows arrive in order, in bands of any height.
+
+    Each band is filtered (PNG "Sub" filter, computed with NumPy),
+    compressed incrementally and written out as IDAT chunks straight away,
+    so memory use depends on the band size only. Use as a context manager,
+    or call close() once every row has been written.
+    """
+
+    SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    COLOR_TYPES = {"L": (0, 1), "RGB": (2, 3), "RGBA": (6, 4)}  # mode: (PNG color type, channels)
+    SUB_FILTER = 1
+
+    def __init__(self, file: BinaryIO, width: int, height: int, mode: str = "RGB",
+                 compression_level: Optional[int] = None):
+        """Start a PNG of the given size and PIL mode on a binary file."""
+        if mode not in self.COLOR_TYPES:
+            raise ValueError(f"Unsupported image mode '{mode}'")
+        self.config = Config()
+        self.file = file
+        self.width = width
+        self.height = height
+        self.color_type, self.channels = self.COLOR_TYPES[mode]
+        self.rows_written = 0
+        self.bytes_written = 0
+        if compression_level is None:
+            compression_level = self.config.POSTER_COMPRESSION_LEVEL
+        self._compressor = zlib.compressobj(compression_level)
+
+        self.file.write(self.SIGNATURE)
+        self.bytes_written += len(self.SIGNATURE)
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, self.color_type, 0, 0, 0))
+
+    def write_rows(self, pixels: bytes):
+        """
+        Append whole rows of raw pixel data, as returned by Image.tobytes().
+        """
+        stride = self.width * self.channels
+        rows = np.frombuffer(pixels, dtype=np.uint8).reshape(-1, stride)
+        if self.rows_written + len(rows) > self.height:
+            raise ValueError("More rows written than the image height")
+
+        # Each row starts with its filter type; Sub stores the difference
+        # to the same channel of the pixel on the left
+        filtered = np.empty((len(rows), stride + 1), dtype=np.uint8)
+        filtered[:, 0] = self.SUB_FILTER
+        filtered[:, 1:self.channels + 1] = rows[:, :self.channels]
+        np.subtract(rows[:, self.channels:], rows[:, :-self.channels], out=filtered[:, self.channels + 1:])
+
+        data = self._compressor.compress(filtered.tobytes())
+        if data:
+            self._write_chunk(b"IDAT", data)
+        self.rows_written += len(rows)
+
+    def close(self):
+        """
+        Finish the image. Raises ValueError if rows are missing.
+        """
+        if self._compressor is None:
+            return
+        if self.rows_written != self.height:
+            raise ValueError(f"Only {self.rows_written} of {self.height} rows were written")
+        self._write_chunk(b"IDAT", self._compressor.flush())
+        self._write_chunk(b"IEND", b"")
+        self._compressor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes):
+        """Write one length-prefixed, CRC-checked PNG chunk."""
+        crc = zlib.crc32(data, zlib.crc32(chunk_type))
+        self.file.write(struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc))
+        self.bytes_written += len(data) + 12
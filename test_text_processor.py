@@ -0,0 +1,97 @@
+"""
+Equivalence tests for the fused tokenizer.
+
+TextProcessor.process_text_fast must produce exactly the tokens of the
+three-stage process_text (clean_text -> tokenize_text -> filter_words).
+Run with: python -m unittest test_text_processor
+"""
+
+import glob
+import os
+import random
+import unittest
+
+from text_processor import TextProcessor
+
+SAMPLES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples")
+MIN_WORD_LENGTHS = [1, 2, 3, 5]
+
+# Characters the tokenizers treat differently: letters, digits, underscores,
+# apostrophes, punctuation, whitespace and non-ASCII letters, digits and marks
+ALPHABET = (
+    "abcXYZ" "0129" "_" "'" "-.,;:!?\"()[]/\\@#$%&*" " \t\n\r"
+    "éÉßñøæ" "ΣσςΑω" "жЖ" "日本語" "٣߀" "́​ ’" "ǅİ"
+)
+
+
+class TestProcessTextFast(unittest.TestCase):
+    """process_text_fast matches process_text."""
+
+    def assert_equivalent(self, text: str):
+        for min_word_length in MIN_WORD_LENGTHS:
+            processor = TextProcessor()
+            processor.min_word_length = min_word_length
+            with self.subTest(text=text[:80], min_word_length=min_word_length):
+                self.assertEqual(processor.process_text_fast(text), processor.process_text(text))
+
+    def test_sample_files(self):
+        paths = sorted(glob.glob(os.path.join(SAMPLES_DIRECTORY, "*.txt")))
+        self.assertTrue(paths, "no sample files found")
+        for path in paths:
+            with open(path, encoding="utf-8") as file:
+                self.assert_equivalent(file.read())
+
+    def test_edge_cases(self):
+        for text in [
+            "",
+            "   \n\t ",
+            "don't can't 'tis o'clock rock'n'roll ''' 'a'",
+            "abc123 123abc _abc_ a_b_c __init__ 3d 42 x1y2z",
+            "hello-world e-mail end. (parenthesis) \"quoted\"",
+            "naïve café Straße ΣΊΣΥΦΟΣ İstanbul ǅemal",
+            "été a​b non breaking it’s",
+            "٣abc٣ ߀x 日本語のテキスト",
+        ]:
+            self.assert_equivalent(text)
+
+    def test_random_text(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            length = rng.randint(0, 60)
+            self.assert_equivalent("".join(rng.choice(ALPHABET) for _ in range(length)))
+
+    def test_random_words(self):
+        rng = random.Random(1)
+        pieces = ["the", "and", "Word", "word's", "'quoted'", "x_y", "_lead", "trail_",
+                  "42", "a1", "1a", "über", "ΣΟΦΙΑ", "-", "...", "it's", "—dash—"]
+        for _ in range(300):
+            count = rng.randint(1, 12)
+            separators = [rng.choice([" ", "  ", "\n", "\t", ",", ""]) for _ in range(count)]
+            self.assert_equivalent("".join(rng.choice(pieces) + sep for sep in separators))
+
+
+class TestProcessTextStream(unittest.TestCase):
+    """process_text_stream matches process_text_fast on the joined chunks."""
+
+    def test_random_chunking(self):
+        rng = random.Random(2)
+        processor = TextProcessor()
+        for _ in range(200):
+            text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 200)))
+            cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 8)))
+            chunks = [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+            with self.subTest(text=text[:80], cuts=cuts):
+                self.assertEqual(list(processor.process_text_stream(chunks)), processor.process_text_fast(text))
+
+    def test_fragment_is_bounded(self):
+        processor = TextProcessor()
+        processor.config.STREAM_MAX_FRAGMENT_LENGTH = 100
+        complete, pending = "", ""
+        for _ in range(50):
+            complete, pending = processor.split_stream_chunk(pending, "a" * 30)
+            self.assertLessEqual(len(pending), 100)
+        self.assertEqual(processor.split_stream_chunk("ab", "c d"), ("abc ", "d"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,24 @@ Handles all text cleaning, processing, and preparation for word cloud generation
 
 import re
 import string
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
 
 from config_module import Config
+from vocabulary import Vocabulary
+
+# Bump whenever a change to processing alters the tokens produced, so cached
+# word frequencies computed by an older tokenizer are not reused
+TOKENIZER_VERSION = 1
+
+# One cleaned token inside a whitespace-free piece of lowercased text: a run
+# of word characters with the leading and trailing ASCII digits and
+# underscores that tokenize_text would strip left outside the group.
+TOKEN_PATTERN = re.compile(r"[0-9_]*([^\W0-9_](?:\w*[^\W0-9_])?)[0-9_]*")
+
+# Any whitespace character, as str.isspace and str.split define it
+WHITESPACE_PATTERN = re.compile(r"\s")
 
 
 class TextProcessor:
@@ -47,6 +62,109 @@ class TextProcessor:
 
         return filtered_words
 
+    def process_text_fast(self, text: str) -> List[str]:
+        """
+        Single-pass equivalent of process_text.
+
+        Cleaning, tokenization and filtering are fused into one loop over
+        the whitespace-separated pieces of the text. Purely alphabetic pieces
+        are already clean; anything else goes through TOKEN_PATTERN. The
+        result matches the clean_text -> tokenize_text -> filter_words chain.
+        """
+        if not text:
+            return []
+
+        # clean_text keeps apostrophes until the very end, so dropping them
+        # up front joins contractions the same way
+        text = text.lower().replace("'", "")
+
+        stop_words = self.stop_words
+        min_word_length = self.min_word_length
+        find_tokens = TOKEN_PATTERN.findall
+
+        words = []
+        append = words.append
+        for piece in text.split():
+            if piece.isalpha():
+                if len(piece) >= min_word_length and piece not in stop_words:
+                    append(piece)
+                continue
+
+            for word in find_tokens(piece):
+                if len(word) >= min_word_length and word not in stop_words:
+                    append(word)
+        return words
+
+    def process_text_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Process text incrementally from an iterable of lines or chunks.
+
+        Each chunk is only processed up to its last whitespace character; the
+        trailing fragment is carried into the next chunk so that a word split
+        across a chunk edge is emitted once, whole.
+        """
+        pending = ""
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            complete, pending = self.split_stream_chunk(pending, chunk)
+            if complete:
+                yield from self.process_text_fast(complete)
+
+        if pending:
+            yield from self.process_text_fast(pending)
+
+    def encode_text(self, text: str, vocabulary: Vocabulary) -> np.ndarray:
+        """
+        Process text into an array of word ids from vocabulary.
+
+        The text is processed in chunks, so the full list of word strings
+        is never built.
+        """
+        if not text or not text.strip():
+            return np.zeros(0, dtype=np.int32)
+
+        chunk_size = self.config.STREAM_CHUNK_SIZE
+        chunks = (text[i : i + chunk_size] for i in range(0, len(text), chunk_size))
+        return vocabulary.encode(self.process_text_stream(chunks))
+
+    def split_stream_chunk(self, pending: str, chunk: str) -> Tuple[str, str]:
+        """
+        Append a chunk to the fragment carried over from earlier chunks and
+        split the result after its last whitespace character.
+
+        Only the new chunk is searched, so a long run without whitespace is
+        not rescanned chunk after chunk. A fragment that grows past
+        Config.STREAM_MAX_FRAGMENT_LENGTH is returned as complete text
+        rather than carried on, which bounds memory on whitespace-free input.
+        """
+        complete, fragment = self.split_at_word_boundary(chunk)
+        if complete:
+            return pending + complete, fragment
+
+        pending += chunk
+        if len(pending) > self.config.STREAM_MAX_FRAGMENT_LENGTH:
+            return pending, ""
+        return "", pending
+
+    @staticmethod
+    def split_at_word_boundary(text: str) -> Tuple[str, str]:
+        """
+        Split text after its last whitespace character.
+
+        Returns the complete part, which can be processed safely, and the
+        trailing fragment, which may be the start of a word continued by
+        text that has not been read yet.
+        """
+        # re only searches forwards; the first match in the reversed text
+        # is the last whitespace character
+        match = WHITESPACE_PATTERN.search(text[::-1])
+        if match is None:
+            return "", text
+        index = len(text) - match.start()
+        return text[:index], text[index:]
+
     def clean_text(self, text: str) -> str:
         """
         Clean and normalize text for processing.
@@ -0,0 +1,207 @@
+"""
+Trending Counter Module
+Incremental word counting over live text streams, with a sliding time window
+or exponential time decay.
+"""
+
+import heapq
+import math
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from operator import itemgetter
+from typing import Dict, Iterable, Optional
+
+from config_module import Config
+from word_counter import WordCounter
+
+
+class SlidingWindowCounter:
+    """
+    Counts words seen within the last `window_seconds`.
+
+    Words are bucketed by their current count, and the distinct counts are
+    kept sorted, so the top N words can be read off without scanning the
+    vocabulary. Each batch is evicted exactly once when it leaves the window.
+    """
+
+    def __init__(self, window_seconds: Optional[float] = None):
+        """Initialize an empty window."""
+        self.config = Config()
+        self.window_seconds = window_seconds or self.config.TRENDING_WINDOW_SECONDS
+        self.word_counter = WordCounter()
+        self.counts = {}
+        self.latest_timestamp = None
+        self._batches = deque()  # (timestamp, Counter) in arrival order
+        self._buckets = {}  # count -> words with that count, in insertion order
+        self._levels = []  # sorted distinct counts
+
+    def add(self, words: Iterable[str], timestamp: Optional[float] = None):
+        """
+        Add a batch of words observed at timestamp (defaults to now).
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if self.latest_timestamp is not None and timestamp < self.latest_timestamp:
+            raise ValueError("timestamps must not go backwards")
+
+        batch = self.word_counter.count_words(words)
+        self.latest_timestamp = timestamp
+        self._batches.append((timestamp, batch))
+        for word, count in batch.items():
+            self._adjust(word, count)
+        self.expire(timestamp)
+
+    def expire(self, now: Optional[float] = None):
+        """
+        Drop every batch older than the window.
+        """
+        if now is None:
+            now = time.time()
+
+        cutoff = now - self.window_seconds
+        while self._batches and self._batches[0][0] <= cutoff:
+            _, batch = self._batches.popleft()
+            for word, count in batch.items():
+                self._adjust(word, -count)
+
+    def top(self, max_words: int = 50, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Return the top N words, ordered by count.
+
+        Batches older than the window are dropped only when now is given;
+        otherwise the counts are as of the latest timestamp added, which
+        add() has already expired against.
+        """
+        if now is not None:
+            self.expire(now)
+
+        top_words = {}
+        for level in reversed(self._levels):
+            for word in self._buckets[level]:
+                if len(top_words) >= max_words:
+                    return top_words
+                top_words[word] = level
+        return top_words
+
+    def _adjust(self, word: str, delta: int):
+        """Move a word to the bucket for its new count."""
+        old_count = self.counts.get(word, 0)
+        new_count = old_count + delta
+
+        if old_count:
+            bucket = self._buckets[old_count]
+            del bucket[word]
+            if not bucket:
+                del self._buckets[old_count]
+                del self._levels[bisect_left(self._levels, old_count)]
+
+        if new_count:
+            self.counts[word] = new_count
+            bucket = self._buckets.get(new_count)
+            if bucket is None:
+                bucket = self._buckets[new_count] = {}
+                insort(self._levels, new_count)
+            bucket[word] = None
+        else:
+            del self.counts[word]
+
+
+class DecayingCounter:
+    """
+    Counts words with exponential time decay.
+
+    Uses forward decay: each occurrence is weighted by 2 ** (age / half_life)
+    relative to a fixed landmark, so stored scores never have to be decayed
+    and only grow. That lets the top `max_words` be maintained exactly from
+    the words touched by each batch. Scores are rebased onto a new landmark
+    once they grow large, which also drops words that have decayed away.
+    """
+
+    # Rebase once weights reach 2 ** _REBASE_HALF_LIVES
+    _REBASE_HALF_LIVES = 64
+    # Words whose decayed score falls below this are dropped on rebase
+    _MIN_SCORE = 1e-6
+
+    def __init__(self, half_life_seconds: Optional[float] = None, max_words: Optional[int] = None):
+        """Initialize an empty counter."""
+        self.config = Config()
+        self.half_life_seconds = half_life_seconds or self.config.TRENDING_HALF_LIFE_SECONDS
+        self.max_words = max_words or self.config.DEFAULT_MAX_WORDS
+        self.word_counter = WordCounter()
+        self.scores = {}
+        self.landmark = None
+        self.latest_timestamp = None
+        self._top = {}  # the max_words highest scores, word -> score
+
+    def add(self, words: Iterable[str], timestamp: Optional[float] = None):
+        """
+        Add a batch of words observed at timestamp (defaults to now).
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if self.latest_timestamp is not None and timestamp < self.latest_timestamp:
+            raise ValueError("timestamps must not go backwards")
+
+        if self.landmark is None:
+            self.landmark = timestamp
+        elif timestamp - self.landmark >= self._REBASE_HALF_LIVES * self.half_life_seconds:
+            self._rebase(timestamp)
+        self.latest_timestamp = timestamp
+
+        weight = self._weight(timestamp)
+        batch = self.word_counter.count_words(words)
+        scores = self.scores
+        candidates = dict(self._top)
+        for word, count in batch.items():
+            score = scores.get(word, 0.0) + count * weight
+            scores[word] = score
+            candidates[word] = score
+
+        # Scores only grow, so a word outside the top can only enter it
+        # when it is part of the current batch
+        self._top = dict(heapq.nlargest(self.max_words, candidates.items(), key=itemgetter(1)))
+
+    def top(self, max_words: Optional[int] = None, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Return the top N words with their decayed counts as of now
+        (defaults to the latest timestamp added).
+
+        Only the counter's own max_words words are tracked, so asking for
+        more raises ValueError.
+        """
+        if max_words is None:
+            max_words = self.max_words
+        elif max_words > self.max_words:
+            raise ValueError(f"only the top {self.max_words} words are tracked, not {max_words}")
+        if not self._top:
+            return {}
+        if now is None:
+            now = self.latest_timestamp
+
+        scale = self._decay(now)
+        top_words = sorted(self._top.items(), key=itemgetter(1), reverse=True)
+        return {word: score * scale for word, score in top_words[:max_words]}
+
+    def _weight(self, timestamp: float) -> float:
+        """Forward-decay weight of an occurrence at timestamp."""
+        return math.pow(2.0, (timestamp - self.landmark) / self.half_life_seconds)
+
+    def _decay(self, now: float) -> float:
+        """
+        Factor turning scores into counts as of now: 1 / _weight(now),
+        computed directly so that it underflows to 0 after a long gap
+        instead of the weight overflowing.
+        """
+        return math.pow(2.0, min(0.0, self.landmark - now) / self.half_life_seconds)
+
+    def _rebase(self, timestamp: float):
+        """Move the landmark to timestamp and rescale all scores."""
+        scale = self._decay(timestamp)
+        self.scores = {
+            word: score * scale
+            for word, score in self.scores.items()
+            if score * scale >= self._MIN_SCORE
+        }
+        self._top = {word: score * scale for word, score in self._top.items() if word in self.scores}
+        self.landmark = timestamp
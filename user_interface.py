@@ -3,7 +3,9 @@ User Interface Module
 Handles all user interactions, input, and output.
 """
 
-from typing import List, Dict, Any
+import heapq
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple
 
 from config_module import Config
 
@@ -197,36 +199,7 @@ class UserInterface:
             except ValueError:
                 self.show_error("Invalid input. Please enter a number.")
 
-        # Color scheme
-        available_schemes = self.config.get_color_scheme_names()
-        while True:
-            print("\nAvailable color schemes:")
-            for i, scheme in enumerate(available_schemes):
-                print(f"{i+1}. {scheme.capitalize()}")
-            color_choice = input(
-                f"Enter choice (1-{len(available_schemes)}) or leave blank for default ({self.config.DEFAULT_COLOR_SCHEME.capitalize()}): "
-            ).strip()
-
-            if not color_choice:
-                preferences["color_scheme"] = self.config.DEFAULT_COLOR_SCHEME
-                break
-
-            try:
-                scheme_idx = int(color_choice) - 1
-                if 0 <= scheme_idx < len(available_schemes):
-                    preferences["color_scheme"] = available_schemes[scheme_idx]
-                    break
-                else:
-                    self.show_error("Invalid choice. Please enter a valid number.")
-            except ValueError:
-                self.show_error("Invalid input. Please enter a number.")
-
-        # Background color (optional)
-        background_color = input(
-            f"Enter background color (e.g., 'white', 'black', 'lightblue', default: {self.config.DEFAULT_BACKGROUND_COLOR}): "
-        ).strip()
-        if background_color:
-            preferences["background_color"] = background_color
+        preferences.update(self.get_color_preferences())
 
         # Mask image path (optional)
         available_masks = self.config.get_predefined_mask_names()
@@ -264,6 +237,64 @@ class UserInterface:
 
         return preferences
 
+    def get_color_preferences(self) -> Dict[str, Any]:
+        """
+        Gets the color scheme and background color from the user.
+        """
+        color_preferences = {}
+
+        # Color scheme
+        available_schemes = self.config.get_color_scheme_names()
+        while True:
+            print("\nAvailable color schemes:")
+            for i, scheme in enumerate(available_schemes):
+                print(f"{i+1}. {scheme.capitalize()}")
+            color_choice = input(
+                f"Enter choice (1-{len(available_schemes)}) or leave blank for default ({self.config.DEFAULT_COLOR_SCHEME.capitalize()}): "
+            ).strip()
+
+            if not color_choice:
+                color_preferences["color_scheme"] = self.config.DEFAULT_COLOR_SCHEME
+                break
+
+            try:
+                scheme_idx = int(color_choice) - 1
+                if 0 <= scheme_idx < len(available_schemes):
+                    color_preferences["color_scheme"] = available_schemes[scheme_idx]
+                    break
+                else:
+                    self.show_error("Invalid choice. Please enter a valid number.")
+            except ValueError:
+                self.show_error("Invalid input. Please enter a number.")
+
+        # Background color (optional)
+        background_color = input(
+            f"Enter background color (e.g., 'white', 'black', 'lightblue', default: {self.config.DEFAULT_BACKGROUND_COLOR}): "
+        ).strip()
+        if background_color:
+            color_preferences["background_color"] = background_color
+
+        return color_preferences
+
+    def ask_recolor(self) -> bool:
+        """
+        Asks the user if they want to try other colors on the same word cloud.
+        """
+        while True:
+            response = (
+                input("\nDo you want to try different colors? (yes[y]/no[n]): ")
+                .lower()
+                .strip()
+            )
+            if response in ["yes", "y"]:
+                return True
+            elif response in ["no", "n"]:
+                return False
+            else:
+                self.show_error(
+                    "Invalid response. Please type (yes[y]/no[n]):"
+                )
+
     def show_processing_step(self, step_name: str, count: int = None):
         """
         Shows a message indicating a processing step is complete.
@@ -281,6 +312,17 @@ class UserInterface:
             f"Found {len(word_frequencies)} unique words after filtering."
         )
 
+    def show_approximate_count_info(self, approximate_frequencies: Dict[str, Tuple[int, int]]):
+        """
+        Displays the error bound of approximate word counts.
+        """
+        if not approximate_frequencies:
+            return
+        max_error = max(error for _, error in approximate_frequencies.values())
+        self.show_message(
+            f"Word counts are approximate and may be overestimated by up to {max_error}."
+        )
+
     def show_top_words(self, word_frequencies: Dict[str, int]):
         """
         Displays the top words and their counts.
@@ -293,11 +335,11 @@ class UserInterface:
             print("No words to display.")
             return
 
-        # Sort and display top words
-        sorted_words = sorted(
-            word_frequencies.items(), key=lambda item: item[1], reverse=True
+        # Pick and display top words without sorting the whole table
+        top_words = heapq.nlargest(
+            self.max_display_words, word_frequencies.items(), key=itemgetter(1)
         )
-        for i, (word, count) in enumerate(sorted_words[: self.max_display_words]):
+        for i, (word, count) in enumerate(top_words):
             print(f"{i+1}. {word}: {count}")
         self._print_separator()
 
@@ -336,8 +378,30 @@ class UserInterface:
             filename.endswith(".png")
             or filename.endswith(".jpg")
             or filename.endswith(".jpeg")
+            or filename.endswith(".webp")
         ):
-            print("Warning: Recommended image format is .png or .jpg. Appending .png.")
+            print("Warning: Recommended image format is .png, .jpg or .webp. Appending .png.")
             filename += ".png"
 
         return filename
+
+    def ask_export_all(self) -> bool:
+        """
+        Asks the user if they want copies in every export format and thumbnails too.
+        """
+        formats = ", ".join(format_name.upper() for format_name in self.config.EXPORT_FORMATS)
+        sizes = ", ".join(f"{width}x{height}" for width, height in self.config.EXPORT_THUMBNAIL_SIZES)
+        while True:
+            response = (
+                input(f"Also save as {formats} and thumbnails ({sizes})? (yes/y/no/n): ")
+                .lower()
+                .strip()
+            )
+            if response in ["yes", "y"]:
+                return True
+            elif response in ["no", "n"]:
+                return False
+            else:
+                self.show_error(
+                    "Invalid response. Please type 'yes'/'y' or 'no'/'n'."
+                )
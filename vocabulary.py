@@ -0,0 +1,93 @@
+"""
+Vocabulary Module
+Interns words as integer ids so token streams can be stored and counted as
+NumPy arrays.
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+
+def top_indices(counts: np.ndarray, max_words: int) -> np.ndarray:
+    """
+    Return the indices of the N largest counts, largest first.
+
+    Equal counts are ordered by index, so the result is deterministic.
+    Only the entries that can make the cut are sorted.
+    """
+    if max_words <= 0 or len(counts) == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    if max_words < len(counts):
+        # Keep everything at least as large as the Nth largest count
+        threshold = np.partition(counts, len(counts) - max_words)[-max_words]
+        candidates = np.flatnonzero(counts >= threshold)
+    else:
+        candidates = np.arange(len(counts))
+
+    order = np.lexsort((candidates, -counts[candidates].astype(np.int64)))
+    return candidates[order][:max_words]
+
+
+class Vocabulary:
+    """
+    Maps words to dense integer ids, assigned in order of first appearance.
+    """
+
+    def __init__(self):
+        """Initialize an empty vocabulary."""
+        self.word_to_id = {}
+        self._words = []
+
+    def __len__(self) -> int:
+        return len(self.word_to_id)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.word_to_id
+
+    @property
+    def words(self) -> List[str]:
+        """
+        All interned words, indexed by id.
+        """
+        if len(self._words) != len(self.word_to_id):
+            # Dicts keep insertion order, which is id order
+            self._words = list(self.word_to_id)
+        return self._words
+
+    def intern(self, word: str) -> int:
+        """
+        Return the id of word, assigning a new one if it is unseen.
+        """
+        return self.word_to_id.setdefault(word, len(self.word_to_id))
+
+    def encode(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Convert a stream of words into a compact array of ids.
+        """
+        word_to_id = self.word_to_id
+        setdefault = word_to_id.setdefault
+        return np.fromiter(
+            (setdefault(word, len(word_to_id)) for word in words), dtype=np.int32
+        )
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """
+        Convert ids back into words.
+        """
+        words = self.words
+        return [words[word_id] for word_id in ids]
+
+    def count(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Count occurrences of every id; entry i is the count of word i.
+        """
+        return np.bincount(ids, minlength=len(self))
+
+    def to_frequencies(self, counts: np.ndarray, max_words: int) -> Dict[str, int]:
+        """
+        Convert a count array into the top N word -> count mapping.
+        """
+        words = self.words
+        return {words[i]: int(counts[i]) for i in top_indices(counts, max_words)}
@@ -2,29 +2,181 @@
 Word Counter Module
 """
 
-from typing import List, Dict
+import heapq
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from config_module import Config
+from frequency_snapshot import FrequencySnapshot
+from vocabulary import Vocabulary
 
 
 class WordCounter:
     """
     Counts the frequency of words and provides methods to retrieve top words.
+
+    Counting is done by collections.Counter in C, and the top N words are
+    picked with a heap instead of sorting the whole vocabulary. Words with
+    equal counts keep the order in which they were first seen, so the output
+    is stable for a given input.
     """
 
     def count_word_frequencies(
-        self, words: List[str], max_words: int = 50
+        self, words: Iterable[str], max_words: int = 50
     ) -> Dict[str, int]:
         """
         Count frequency of each word and return the top N words.
         """
+        _, top_words = self.count_and_select(words, max_words)
+        return top_words
+
+    def count_words(self, words: Iterable[str]) -> Counter:
+        """
+        Count every word, keeping the full vocabulary.
+        """
         if not words:
+            return Counter()
+        return Counter(words)
+
+    def count_word_ids(
+        self, ids: np.ndarray, vocabulary: Vocabulary, max_words: int = 50
+    ) -> Dict[str, int]:
+        """
+        Count an array of interned word ids and return the top N words.
+
+        Ids are assigned in order of first appearance, so ties resolve the
+        same way as count_word_frequencies.
+        """
+        if len(ids) == 0:
             return {}
+        return vocabulary.to_frequencies(vocabulary.count(ids), max_words)
 
-        word_count = {}  # Initialize empty dictionary
+    def create_snapshot(self, words: Iterable[str]) -> FrequencySnapshot:
+        """
+        Count every word into a mergeable, serializable frequency snapshot.
+        """
+        return FrequencySnapshot.from_counts(self.count_words(words))
+
+    def count_approximate_frequencies(
+        self, words: Iterable[str], max_words: int = 50, capacity: Optional[int] = None
+    ) -> Dict[str, Tuple[int, int]]:
+        """
+        Approximate the top N words using a fixed number of counter slots.
+
+        Returns a mapping of word to (estimated count, maximum error). The
+        true count of each word lies between estimate - error and estimate.
+        """
+        if capacity is None:
+            capacity = Config.APPROXIMATE_COUNTER_CAPACITY
+
+        counter = SpaceSavingCounter(max(capacity, max_words))
+        counter.update(words)
+        return counter.top(max_words)
+
+    def count_and_select(
+        self, words: Iterable[str], max_words: int = 50
+    ) -> Tuple[Counter, Dict[str, int]]:
+        """
+        Count every word and pick the top N from the same pass.
+
+        Returns the full counts and the top N words, ordered by count.
+        """
+        word_count = self.count_words(words)
+        return word_count, self.select_top_words(word_count, max_words)
+
+    def select_top_words(
+        self, word_count: Dict[str, int], max_words: int = 50
+    ) -> Dict[str, int]:
+        """
+        Return the top N words of an existing frequency table.
+
+        Ties keep the order in which words appear in word_count.
+        """
+        if not word_count or max_words <= 0:
+            return {}
+
+        # nlargest is stable, so equal counts keep their insertion order
+        return dict(heapq.nlargest(max_words, word_count.items(), key=itemgetter(1)))
+
+
+class SpaceSavingCounter:
+    """
+    Approximate heavy-hitter counter using the Space-Saving algorithm.
+
+    At most `capacity` words are tracked. When a new word arrives and every
+    slot is taken, the word with the smallest count is replaced and the new
+    word inherits that count as its error. Estimates never undercount, they
+    overcount by at most total / capacity, and every word whose true count
+    exceeds total / capacity is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize an empty counter with a fixed number of slots."""
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        # One (count, word) entry per tracked word. Counts in the heap may
+        # lag behind self.counts and are refreshed lazily on eviction.
+        self._heap = []
+
+    def update(self, words: Iterable[str]):
+        """
+        Add a sequence of words to the counter.
+        """
+        counts = self.counts
+        errors = self.errors
+        heap = self._heap
+        capacity = self.capacity
+        total = 0
 
         for word in words:
-            word_count[word] = word_count.get(word, 0) + 1
+            total += 1
+            if word in counts:
+                counts[word] += 1
+                continue
+
+            if len(counts) < capacity:
+                counts[word] = 1
+                errors[word] = 0
+                heapq.heappush(heap, (1, word))
+                continue
+
+            # Find the tracked word with the smallest up-to-date count
+            while True:
+                count, victim = heap[0]
+                current = counts[victim]
+                if count == current:
+                    break
+                heapq.heapreplace(heap, (current, victim))
+
+            del counts[victim]
+            del errors[victim]
+            counts[word] = count + 1
+            errors[word] = count
+            heapq.heapreplace(heap, (count + 1, word))
+
+        self.total += total
 
-        sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
+    @property
+    def max_error(self) -> int:
+        """
+        Upper bound on the overcount of any estimate.
+        """
+        return self.total // self.capacity
+
+    def top(self, max_words: int = 50) -> Dict[str, Tuple[int, int]]:
+        """
+        Return the top N words as word -> (estimated count, maximum error).
+        """
+        if max_words <= 0:
+            return {}
 
-        # Return only the top words
-        return dict(sorted_words[:max_words])
+        top_words = heapq.nlargest(max_words, self.counts.items(), key=itemgetter(1))
+        return {word: (count, self.errors[word]) for word, count in top_words}
@@ -3,12 +3,21 @@
 Word Cloud Generator - Main Program
 """
 
+import argparse
+import os
 import sys
 
 from config_module import Config
 from file_manager import FileManager
+from file_watcher import FileWatcher
+from frequency_cache import FrequencyCache
+from frequency_snapshot import FrequencySnapshot
+from image_exporter import ImageExporter
+from layout_document import LayoutDocument
+from parallel_processor import ParallelProcessor
 from text_processor import TextProcessor
 from user_interface import UserInterface
+from vocabulary import Vocabulary
 from word_counter import WordCounter
 from wordcloud_visualizer import WordCloudVisualizer
 
@@ -27,9 +36,14 @@ class WordCloudApp:
         self.file_manager = FileManager()
         self.text_processor = TextProcessor()
         self.word_counter = WordCounter()
+        self.parallel_processor = ParallelProcessor(self.text_processor)
+        self.frequency_cache = FrequencyCache()
         self.visualizer = WordCloudVisualizer()
         self.ui = UserInterface()
 
+        # File the current text was loaded from, if any
+        self.source_path = None
+
         # Initialize sample files
         self.file_manager.create_sample_files()
 
@@ -74,10 +88,49 @@ class WordCloudApp:
                 if not self.ui.ask_continue():
                     break
 
+    def run_watch(self, sources, output_path, interval=None):
+        """
+        Follow growing files and re-render the word cloud as they change.
+        """
+        watcher = FileWatcher(
+            sources, self.file_manager, self.text_processor, self.word_counter
+        )
+        max_words = self.config.DEFAULT_MAX_WORDS
+
+        def render(word_count):
+            word_frequencies = self.word_counter.select_top_words(word_count, max_words)
+            wordcloud = self.visualizer.generate_word_cloud(
+                word_frequencies,
+                color_scheme=self.config.DEFAULT_COLOR_SCHEME,
+                background_color=self.config.DEFAULT_BACKGROUND_COLOR,
+                max_words=max_words,
+            )
+            if wordcloud:
+                self.visualizer.save_word_cloud(wordcloud, output_path)
+
+        self.ui.show_message(f"Watching {', '.join(sources)}. Press Ctrl+C to stop.")
+        try:
+            watcher.run(render, interval)
+        except KeyboardInterrupt:
+            self.ui.show_message("Stopped watching.")
+
+    def run_render_layout(self, document_path, output_path, scale=1.0, color_scheme=None,
+                          background_color=None):
+        """
+        Draw a saved layout document without processing text or laying
+        out words.
+        """
+        document = LayoutDocument.load(document_path)
+        if document is None:
+            return False
+        return self.visualizer.render_layout(document, output_path, scale, color_scheme, background_color)
+
     def _get_text_from_choice(self, choice):
         """
         Get text content based on user's menu choice.
         """
+        self.source_path = None
+
         if choice == 1:
             return self.ui.get_user_text_input()
 
@@ -105,6 +158,7 @@ class WordCloudApp:
             text = self.file_manager.read_text_file(filepath)
             if text:
                 self.ui.show_message(f"Loaded: {selected_file}")
+                self.source_path = filepath
             return text
 
         return ""
@@ -138,14 +192,8 @@ class WordCloudApp:
         fill_canvas = preferences.get('fill_canvas', False)
 
         try:
-            # Step 1: Process the text
-            processed_text = self.text_processor.process_text(text)
-            self.ui.show_processing_step("Text cleaned", len(processed_text))
-
-            # Step 2: Count word frequencies
-            word_frequencies = self.word_counter.count_word_frequencies(
-                processed_text, max_words
-            )
+            # Steps 1 and 2: Process the text and count word frequencies
+            word_frequencies = self._count_word_frequencies(text, max_words)
             self.ui.show_word_count_info(word_frequencies)
 
             # Step 3: Create and display word cloud
@@ -164,28 +212,167 @@ class WordCloudApp:
             if wordcloud:
                 # Show top words to user
                 self.ui.show_top_words(word_frequencies)
+                # Try other colors; the layout is cached, so only the colors are redrawn
+                while self.ui.ask_recolor():
+                    color_preferences = self.ui.get_color_preferences()
+                    color_scheme = color_preferences.get("color_scheme", color_scheme)
+                    background_color = color_preferences.get("background_color", background_color)
+                    wordcloud = self.visualizer.create_word_cloud(
+                        word_frequencies, color_scheme=color_scheme, background_color=background_color,
+                        mask_image_path=mask_image_path,
+                        fill_canvas=fill_canvas
+                    )
                 # Handle saving if requested
                 self._handle_save_request(wordcloud)
 
         except Exception as e:
             self.ui.show_error(f"Error processing text: {e}")
 
+    def _count_word_frequencies(self, text, max_words):
+        """
+        Process text and count its top words with the configured strategy.
+        """
+        if self.config.USE_APPROXIMATE_COUNTING:
+            # Stream tokens a chunk at a time into a bounded-memory counter,
+            # so the full token list is never built
+            chunk_size = self.config.STREAM_CHUNK_SIZE
+            chunks = (text[i : i + chunk_size] for i in range(0, len(text), chunk_size))
+            approximate_frequencies = self.word_counter.count_approximate_frequencies(
+                self.text_processor.process_text_stream(chunks),
+                max_words,
+                self.config.APPROXIMATE_COUNTER_CAPACITY,
+            )
+            self.ui.show_processing_step("Text cleaned")
+            self.ui.show_approximate_count_info(approximate_frequencies)
+            return {word: count for word, (count, _) in approximate_frequencies.items()}
+
+        if self.source_path and self.config.USE_FREQUENCY_CACHE:
+            return self._count_cached_word_frequencies(text, max_words)
+
+        if self.config.USE_VECTORIZED_COUNTING:
+            # Process the text into interned word ids and count them
+            vocabulary = Vocabulary()
+            word_ids = self.text_processor.encode_text(text, vocabulary)
+            self.ui.show_processing_step("Text cleaned", len(word_ids))
+            return self.word_counter.count_word_ids(word_ids, vocabulary, max_words)
+
+        if self.parallel_processor.should_use_parallel(text):
+            # Process and count across worker processes
+            word_count = self.parallel_processor.count_words(text)
+            self.ui.show_processing_step("Text cleaned", sum(word_count.values()))
+            return self.word_counter.select_top_words(word_count, max_words)
+
+        processed_text = self.text_processor.process_text_fast(text)
+        self.ui.show_processing_step("Text cleaned", len(processed_text))
+        return self.word_counter.count_word_frequencies(processed_text, max_words)
+
+    def _count_cached_word_frequencies(self, text, max_words):
+        """
+        Count the top words of the current file, reusing cached counts.
+        """
+        cache_key = self.frequency_cache.make_key(text, self.text_processor)
+        snapshot = self.frequency_cache.get(cache_key)
+
+        if snapshot is not None:
+            self.ui.show_message("Loaded word frequencies from cache.")
+        else:
+            if self.parallel_processor.should_use_parallel(text):
+                word_count = self.parallel_processor.count_words(text)
+            else:
+                word_count = self.word_counter.count_words(
+                    self.text_processor.process_text_fast(text)
+                )
+            self.ui.show_processing_step("Text cleaned", sum(word_count.values()))
+
+            snapshot = FrequencySnapshot.from_counts(word_count)
+            self.frequency_cache.put(cache_key, snapshot)
+
+        # Cold and warm runs both rank from the snapshot, so ties match
+        return snapshot.top_words(max_words)
+
     def _handle_save_request(self, wordcloud):
         """Handle user request to save the word cloud."""
         if self.ui.ask_save():
             filename = self.ui.get_save_filename()
-            success = self.visualizer.save_word_cloud(wordcloud, filename)
-            if success:
-                self.ui.show_message(f"Word cloud saved as '{filename}'")
+            base_path = os.path.splitext(filename)[0]
+            formats = [ImageExporter.format_for_path(filename)]
+            thumbnail_sizes = []
+            if self.ui.ask_export_all():
+                formats += [name for name in self.config.EXPORT_FORMATS if name not in formats]
+                thumbnail_sizes = self.config.EXPORT_THUMBNAIL_SIZES
+
+            # The image is rendered once and every file is encoded from it;
+            # the first goes to exactly the filename the user entered
+            reports = self.visualizer.export_word_cloud(
+                wordcloud, base_path, formats, thumbnail_sizes, primary_path=filename
+            )
+            if reports and all(report["success"] for report in reports):
+                others = len(reports) - 1
+                suffix = f" (and {others} more file(s))" if others else ""
+                self.ui.show_message(f"Word cloud saved as '{reports[0]['path']}'{suffix}")
             else:
                 self.ui.show_error("Failed to save word cloud")
 
 
 def main():
     """Entry point of the application."""
+    parser = argparse.ArgumentParser(description="Word Cloud Generator")
+    parser.add_argument(
+        "--watch",
+        nargs="+",
+        metavar="PATH",
+        help="follow files, directories or glob patterns and re-render as they grow",
+    )
+    parser.add_argument(
+        "--output",
+        default=f"wordcloud.{Config.DEFAULT_SAVE_FORMAT}",
+        help="image file written in watch and render-layout modes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=Config.WATCH_INTERVAL_SECONDS,
+        help="seconds between checks in watch mode",
+    )
+    parser.add_argument(
+        "--render-layout",
+        metavar="DOCUMENT",
+        help="draw a saved layout document to --output (an image or .svg) and exit",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="size multiplier when drawing a saved layout",
+    )
+    parser.add_argument(
+        "--color-scheme",
+        choices=Config.get_color_scheme_names(),
+        help="recolor a saved layout with this color scheme",
+    )
+    parser.add_argument(
+        "--background",
+        help="background color when drawing a saved layout",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="render straight to image files without opening a window",
+    )
+    args = parser.parse_args()
+
     try:
         app = WordCloudApp()
-        app.run()
+        if args.headless:
+            app.visualizer.headless = True
+        if args.render_layout:
+            if not app.run_render_layout(args.render_layout, args.output, args.scale,
+                                         args.color_scheme, args.background):
+                sys.exit(1)
+        elif args.watch:
+            app.run_watch(args.watch, args.output, args.interval)
+        else:
+            app.run()
     except Exception as e:
         print(f"Fatal error: {e}")
         sys.exit(1)
@@ -3,12 +3,441 @@ Word Cloud Visualizer Module
 Handles the generation and display of word clouds.
 """
 
-import matplotlib.pyplot as plt
 from wordcloud import WordCloud
+import copy
 import numpy as np
-import random
-from typing import Dict, Any, Optional
+import math
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from random import Random
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+from color_engine import ColorEngine
 from config_module import Config
+from image_exporter import ImageExporter
+from layout_document import LayoutDocument
+from layout_cache import LayoutCache, layout_to_document, restore_layout
+from mask_cache import MaskCache
+from png_writer import PngStreamWriter
+
+
+def _uncolored(word, **kwargs):
+    """Placeholder color function used while placing words."""
+    return None
+
+
+# Scratch surface for measuring text
+_MEASURE = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+@lru_cache(maxsize=Config.FONT_CACHE_SIZE)
+def _load_font(font_path: str, font_size: int, orientation) -> ImageFont.TransposedFont:
+    """Load a font at a size and orientation, reusing ones loaded before."""
+    return ImageFont.TransposedFont(ImageFont.truetype(font_path, font_size), orientation=orientation)
+
+
+class GlyphCache:
+    """
+    Size-capped cache of measured and rasterized words.
+    
+    Extents are kept for every (font, word, font size, orientation) that
+    is measured while searching for a font size, and the rasterized shape
+    for every one that gets placed. Entries are dropped least recently used
+    first once their estimated memory passes max_bytes.
+    """
+    
+    EXTENT_BYTES = 200  # Rough memory held by one cached extent
+    
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.config = Config()
+        self.max_bytes = max_bytes or self.config.GLYPH_CACHE_MAX_BYTES
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def measure(self, font_path: str, word: str, font_size: int, orientation) -> Tuple[int, int]:
+        """
+        Return the (width, height) of word drawn with the given font.
+        """
+        key = ('extent', font_path, word, font_size, orientation)
+        extent = self._get(key)
+        if extent is None:
+            font = _load_font(font_path, font_size, orientation)
+            box = _MEASURE.textbbox((0, 0), word, font=font, anchor="lt")
+            extent = (box[2], box[3])
+            self._put(key, extent, self.EXTENT_BYTES)
+        return extent
+    
+    def rasterize(self, font_path: str, word: str, font_size: int, orientation) -> np.ndarray:
+        """
+        Return a read-only boolean array of the pixels word covers when drawn
+        at the origin, the way WordCloud.to_image draws it.
+        """
+        key = ('shape', font_path, word, font_size, orientation)
+        shape = self._get(key)
+        if shape is None:
+            width, height = self.measure(font_path, word, font_size, orientation)
+            glyph = Image.new("L", (width, height))
+            ImageDraw.Draw(glyph).text((0, 0), word, fill="white",
+                                       font=_load_font(font_path, font_size, orientation))
+            shape = np.asarray(glyph) > 0
+            shape.flags.writeable = False
+            self._put(key, shape, self.EXTENT_BYTES + shape.nbytes)
+        return shape
+    
+    def clear(self):
+        """
+        Forget all cached extents and shapes.
+        """
+        self._entries.clear()
+        self.size_bytes = 0
+    
+    def _get(self, key):
+        """Look up an entry, marking it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+    
+    def _put(self, key, value, size_bytes: int):
+        """Store an entry, then evict the oldest ones past the size cap."""
+        self._entries[key] = (value, size_bytes)
+        self.size_bytes += size_bytes
+        while self.size_bytes > self.max_bytes and self._entries:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_bytes
+
+
+# Shared by every layout in the process, so repeated and batch renders
+# reuse the measurements of words they have seen before
+_glyph_cache = GlyphCache()
+
+
+class SummedAreaOccupancy:
+    """
+    Occupancy grid of a canvas, searched for free space with summed-area
+    tables.
+    
+    Free positions for a box are found for the whole canvas at once with
+    four shifted array slices. A coarse grid, where a cell is occupied if
+    any of its pixels is, is searched first; the exact pixel grid is only
+    scanned when no coarse position fits. Box sizes that fit nowhere are
+    remembered, since the canvas only ever fills up.
+    """
+    
+    def __init__(self, occupied: np.ndarray, cell_size: int = 4):
+        self.occupied = np.array(occupied, dtype=bool)
+        self.height, self.width = self.occupied.shape
+        self.cell_size = max(1, cell_size)
+        self._coarse = self._coarsen(0, self.height // self.cell_size, 0, self.width // self.cell_size)
+        self._table = None  # Summed-area tables, rebuilt when next needed
+        self._coarse_table = None
+        self._failed = []  # (height, width) of boxes known not to fit
+    
+    def find_position(self, box_height: int, box_width: int, random_state) -> Optional[Tuple[int, int]]:
+        """
+        Pick a random free (row, column) for a box, or None if none is left.
+        """
+        if any(box_height >= height and box_width >= width for height, width in self._failed):
+            return None
+        
+        cell = self.cell_size
+        if cell > 1:
+            cells_high, cells_wide = -(-box_height // cell), -(-box_width // cell)
+            if self._coarse_table is None:
+                self._coarse_table = self._summed_area(self._coarse)
+            position = self._sample(self._coarse_table, cells_high, cells_wide, random_state)
+            if position is not None:
+                # Shift by a random amount within the slack of the coarse window
+                return (position[0] * cell + random_state.randint(0, cells_high * cell - box_height),
+                        position[1] * cell + random_state.randint(0, cells_wide * cell - box_width))
+        
+        if self._table is None:
+            self._table = self._summed_area(self.occupied)
+        position = self._sample(self._table, box_height, box_width, random_state)
+        if position is None:
+            self._failed = [(height, width) for height, width in self._failed
+                            if height < box_height or width < box_width]
+            self._failed.append((box_height, box_width))
+        return position
+    
+    def mark(self, row: int, column: int, shape: np.ndarray):
+        """
+        Mark the pixels of a boolean shape drawn at (row, column) as occupied.
+        """
+        self._update(row, column, shape, occupy=True)
+    
+    def unmark(self, row: int, column: int, shape: np.ndarray):
+        """
+        Free the pixels of a shape previously marked at (row, column).
+        """
+        self._update(row, column, shape, occupy=False)
+        # Space was freed, so boxes that did not fit before might now
+        self._failed = []
+    
+    def _update(self, row: int, column: int, shape: np.ndarray, occupy: bool):
+        """Set or clear a shape's pixels and refresh the coarse cells it covers."""
+        rows = min(shape.shape[0], self.height - row)
+        columns = min(shape.shape[1], self.width - column)
+        if rows <= 0 or columns <= 0:
+            return
+        region = self.occupied[row:row + rows, column:column + columns]
+        if occupy:
+            region |= shape[:rows, :columns]
+        else:
+            region &= ~shape[:rows, :columns]
+        
+        cell = self.cell_size
+        top, left = row // cell, column // cell
+        bottom = min(self._coarse.shape[0], -(-(row + rows) // cell))
+        right = min(self._coarse.shape[1], -(-(column + columns) // cell))
+        if top < bottom and left < right:
+            self._coarse[top:bottom, left:right] = self._coarsen(top, bottom, left, right)
+        self._table = None
+        self._coarse_table = None
+    
+    def _coarsen(self, top: int, bottom: int, left: int, right: int) -> np.ndarray:
+        """Coarse cells in the given cell range: occupied if any pixel is."""
+        cell = self.cell_size
+        block = self.occupied[top * cell:bottom * cell, left * cell:right * cell]
+        return block.reshape(bottom - top, cell, right - left, cell).any(axis=(1, 3))
+    
+    @staticmethod
+    def _summed_area(grid: np.ndarray) -> np.ndarray:
+        """Summed-area table with a leading row and column of zeros."""
+        table = np.zeros((grid.shape[0] + 1, grid.shape[1] + 1), dtype=np.int32)
+        np.cumsum(grid, axis=0, out=table[1:, 1:])
+        np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+        return table
+    
+    @staticmethod
+    def _sample(table: np.ndarray, box_height: int, box_width: int, random_state) -> Optional[Tuple[int, int]]:
+        """Pick a random top-left corner of an empty box_height x box_width window."""
+        if box_height >= table.shape[0] or box_width >= table.shape[1]:
+            return None
+        free = (table[box_height:, box_width:] - table[:-box_height, box_width:]
+                - table[box_height:, :-box_width] + table[:-box_height, :-box_width]) == 0
+        hits = np.flatnonzero(free)
+        if not len(hits):
+            return None
+        return divmod(int(hits[random_state.randrange(len(hits))]), free.shape[1])
+
+
+class NativeLayoutEngine:
+    """
+    Places words like WordCloud.generate_from_frequencies, using a
+    SummedAreaOccupancy grid instead of the library's integral image.
+    
+    The font-size search (relative scaling, trying the other orientation,
+    then stepping the font down) follows the library, and the result is a
+    regular WordCloud layout_, so everything that draws, recolors or caches
+    a layout works unchanged. Each placed word is rasterized on its own and
+    merged into the grid, rather than redrawing and rescanning the whole
+    canvas after every word. Measurements and shapes come from the
+    process-wide glyph cache unless another GlyphCache is given.
+    """
+    
+    def __init__(self, cell_size: Optional[int] = None, glyph_cache: Optional[GlyphCache] = None):
+        self.config = Config()
+        self.cell_size = cell_size or self.config.NATIVE_LAYOUT_CELL_SIZE
+        self.glyph_cache = glyph_cache or _glyph_cache
+    
+    def generate(self, wordcloud: WordCloud, frequencies: Dict[str, float]) -> WordCloud:
+        """
+        Lay out frequencies on wordcloud using its settings, filling in its
+        layout_ and words_.
+        """
+        frequencies = self.normalize(wordcloud, frequencies)
+        if not frequencies:
+            raise ValueError("We need at least 1 word to plot a word cloud, got 0.")
+        
+        random_state = wordcloud.random_state if wordcloud.random_state is not None else Random()
+        font_size = self.initial_font_size(wordcloud, frequencies, random_state)
+        
+        wordcloud.words_ = dict(frequencies)
+        wordcloud.layout_ = self._place(wordcloud, frequencies, font_size, random_state)
+        return wordcloud
+    
+    @staticmethod
+    def normalize(wordcloud: WordCloud, frequencies: Dict[str, float]) -> List[Tuple[str, float]]:
+        """
+        The wordcloud's max_words most frequent words, largest first, scaled
+        so the largest frequency is 1.
+        """
+        frequencies = sorted(frequencies.items(), key=itemgetter(1), reverse=True)[:wordcloud.max_words]
+        if not frequencies:
+            return []
+        max_frequency = float(frequencies[0][1])
+        return [(word, freq / max_frequency) for word, freq in frequencies]
+    
+    def initial_font_size(self, wordcloud: WordCloud, frequencies: List[Tuple[str, float]],
+                          random_state) -> int:
+        """
+        The font size of the most frequent word: max_font_size, or, when
+        that is None, one sized from a trial layout of the two largest words.
+        """
+        if wordcloud.max_font_size is not None:
+            return wordcloud.max_font_size
+        if len(frequencies) == 1:
+            return wordcloud.height
+        
+        sizes = [entry[1] for entry in self._place(wordcloud, frequencies[:2], wordcloud.height, random_state)]
+        if not sizes:
+            raise ValueError("Couldn't find space to draw. Either the Canvas size"
+                             " is too small or too much of the image is masked out.")
+        return int(2 * sizes[0] * sizes[1] / (sizes[0] + sizes[1])) if len(sizes) > 1 else sizes[0]
+    
+    def new_occupancy(self, wordcloud: WordCloud) -> SummedAreaOccupancy:
+        """
+        An occupancy grid for wordcloud's canvas with its mask marked occupied.
+        """
+        if wordcloud.mask is not None:
+            occupied = wordcloud._get_bolean_mask(wordcloud.mask)
+        else:
+            occupied = np.zeros((wordcloud.height, wordcloud.width), dtype=bool)
+        return SummedAreaOccupancy(occupied, self.cell_size)
+    
+    def place_word(self, wordcloud: WordCloud, occupancy: SummedAreaOccupancy, word: str,
+                   font_size: int, orientation, random_state) -> Optional[Tuple[int, Tuple[int, int], Any]]:
+        """
+        Find room for word and mark it occupied, trying the other orientation
+        and then smaller font sizes as needed.
+        
+        Returns (font_size, position, orientation) of the placed word, or
+        None if it does not fit even at min_font_size.
+        """
+        tried_other_orientation = False
+        while font_size >= wordcloud.min_font_size:
+            width, height = self.glyph_cache.measure(wordcloud.font_path, word, font_size, orientation)
+            position = occupancy.find_position(height + wordcloud.margin, width + wordcloud.margin,
+                                               random_state)
+            if position is not None:
+                x, y = position[0] + wordcloud.margin // 2, position[1] + wordcloud.margin // 2
+                occupancy.mark(x, y, self.glyph_cache.rasterize(wordcloud.font_path, word, font_size, orientation))
+                return font_size, (x, y), orientation
+            # Try the other orientation before shrinking the font
+            if not tried_other_orientation and wordcloud.prefer_horizontal < 1:
+                orientation = Image.ROTATE_90 if orientation is None else None
+                tried_other_orientation = True
+            else:
+                font_size -= wordcloud.font_step
+                orientation = None
+        return None
+    
+    def _place(self, wordcloud: WordCloud, frequencies: List[Tuple[str, float]],
+               font_size: int, random_state) -> list:
+        """Place words largest first and return the resulting layout."""
+        occupancy = self.new_occupancy(wordcloud)
+        
+        layout = []
+        last_freq = 1.0
+        for word, freq in frequencies:
+            if freq == 0:
+                continue
+            if wordcloud.relative_scaling != 0:
+                font_size = int(round((wordcloud.relative_scaling * (freq / float(last_freq))
+                                       + (1 - wordcloud.relative_scaling)) * font_size))
+            orientation = None if random_state.random() < wordcloud.prefer_horizontal else Image.ROTATE_90
+            placed = self.place_word(wordcloud, occupancy, word, font_size, orientation, random_state)
+            if placed is None:
+                break
+            font_size, position, orientation = placed
+            
+            color = wordcloud.color_func(word, font_size=font_size, position=position, orientation=orientation,
+                                         random_state=random_state, font_path=wordcloud.font_path)
+            layout.append(((word, freq), font_size, position, orientation, color))
+            last_freq = freq
+        
+        return layout
+
+
+class SequenceLayout:
+    """
+    Lays out a series of frequency tables so that consecutive frames look
+    alike.
+    
+    A word that stays in the cloud keeps its position, orientation and font
+    size while the size it should have stays within the resize tolerance
+    (Config.SEQUENCE_RESIZE_TOLERANCE) of the size it was placed for. Words
+    that leave or change size give their space back, and only new or
+    resized words are placed. The occupancy grid is kept between frames,
+    so each frame costs in proportion to how much changed.
+    """
+    
+    def __init__(self, wordcloud: WordCloud, engine: Optional[NativeLayoutEngine] = None,
+                 tolerance: Optional[float] = None):
+        """Start a sequence on an ungenerated word cloud that holds the settings."""
+        self.config = Config()
+        self.wordcloud = wordcloud
+        self.engine = engine or NativeLayoutEngine()
+        self.tolerance = self.config.SEQUENCE_RESIZE_TOLERANCE if tolerance is None else tolerance
+        self.random_state = wordcloud.random_state if wordcloud.random_state is not None else Random()
+        self.occupancy = self.engine.new_occupancy(wordcloud)
+        self.placed = {}  # word -> (target font size, font size, position, orientation)
+        self.base_font_size = None
+        self.changed = 0  # Words placed or removed by the last frame
+    
+    def advance(self, frequencies: Dict[str, float]) -> WordCloud:
+        """
+        Lay out the next frame and return it as a generated word cloud.
+        """
+        wordcloud = self.wordcloud
+        glyph_cache = self.engine.glyph_cache
+        frequencies = [(word, freq) for word, freq in self.engine.normalize(wordcloud, frequencies) if freq > 0]
+        if frequencies and self.base_font_size is None:
+            self.base_font_size = self.engine.initial_font_size(wordcloud, frequencies, self.random_state)
+        targets = self._target_font_sizes(frequencies)
+        self.changed = 0
+        
+        # Give back the space of words that left or changed size
+        for word, (target, font_size, position, orientation) in list(self.placed.items()):
+            new_target = targets.get(word)
+            if new_target is None or abs(new_target - target) > self.tolerance * target:
+                shape = glyph_cache.rasterize(wordcloud.font_path, word, font_size, orientation)
+                self.occupancy.unmark(position[0], position[1], shape)
+                del self.placed[word]
+                self.changed += 1
+        
+        # Place new and resized words, largest first
+        for word, _ in frequencies:
+            target = targets[word]
+            if word in self.placed or target < wordcloud.min_font_size:
+                continue
+            orientation = None if self.random_state.random() < wordcloud.prefer_horizontal else Image.ROTATE_90
+            placed = self.engine.place_word(wordcloud, self.occupancy, word, target, orientation, self.random_state)
+            if placed is not None:
+                self.placed[word] = (target,) + placed
+                self.changed += 1
+        
+        frame = copy.copy(wordcloud)
+        frame.words_ = dict(frequencies)
+        frame.layout_ = []
+        for word, freq in frequencies:
+            if word in self.placed:
+                _, font_size, position, orientation = self.placed[word]
+                color = wordcloud.color_func(word, font_size=font_size, position=position, orientation=orientation,
+                                             random_state=self.random_state, font_path=wordcloud.font_path)
+                frame.layout_.append(((word, freq), font_size, position, orientation, color))
+        return frame
+    
+    def _target_font_sizes(self, frequencies: List[Tuple[str, float]]) -> Dict[str, int]:
+        """Font size each word would get by relative scaling alone."""
+        relative_scaling = self.wordcloud.relative_scaling
+        font_size = self.base_font_size
+        last_freq = 1.0
+        targets = {}
+        for word, freq in frequencies:
+            if relative_scaling != 0:
+                font_size = int(round((relative_scaling * (freq / last_freq) + (1 - relative_scaling)) * font_size))
+            targets[word] = font_size
+            last_freq = freq
+        return targets
 
 
 class WordCloudVisualizer:
@@ -22,39 +451,243 @@ class WordCloudVisualizer:
         self.height = self.config.DEFAULT_HEIGHT
         self.color_schemes = self.config.COLOR_SCHEMES
         self.wordcloud_settings = self.config.WORDCLOUD_SETTINGS
+        self.headless = self.config.HEADLESS_RENDERING
+        self.mask_cache = MaskCache()
+        self.layout_cache = LayoutCache()
+        self.color_engine = ColorEngine(self.wordcloud_settings.get('random_state'))
+        self.layout_engine = NativeLayoutEngine()
+        self.exporter = ImageExporter()
     
-    def get_color_function(self, scheme: str = 'random'):
+    def create_word_cloud(self, word_count: Dict[str, int], color_scheme: str = 'random', 
+                          background_color: str = 'white', mask_image_path: Optional[str] = None,max_words: int = 50, fill_canvas: bool = False,
+                          headless: Optional[bool] = None, output_path: Optional[str] = None) -> Optional[WordCloud]:
         """
-        Create a color function for the word cloud.
+        Create the word cloud visualization using the wordcloud library.
+        
+        If output_path is given, the image is written there once, straight
+        from the layout with PIL; otherwise nothing is written and the
+        caller saves the returned word cloud. In headless mode nothing is
+        displayed, and matplotlib's pyplot is never imported.
         """
-        if scheme not in self.color_schemes or scheme == 'random':
-            return None  # Use WordCloud default
+        wordcloud = self.generate_word_cloud(word_count, color_scheme, background_color,
+                                             mask_image_path, max_words, fill_canvas)
+        if wordcloud is None:
+            return None
         
-        colors = self.color_schemes[scheme]
+        if headless is None:
+            headless = self.headless
+        if not headless:
+            import matplotlib.pyplot as plt
+            
+            # Create the plot
+            plt.figure(figsize=(self.width/100, self.height/100), facecolor=background_color)
+            plt.imshow(wordcloud, interpolation='bilinear')
+            plt.axis('off')  # Remove axes for cleaner look
+            plt.title('Word Cloud', fontsize=16, pad=20)
+            plt.tight_layout(pad=0)
+            plt.gca().set_facecolor(background_color)  # Set axes background
+            
+            # Show the plot
+            plt.show()
         
-        def color_func(word, font_size, position, orientation, random_state=None, **kwargs):
-            """Return a random color from the chosen scheme"""
-            return random.choice(colors)
+        if output_path:
+            self.save_word_cloud(wordcloud, output_path)
+        return wordcloud
+    
+    def generate_word_cloud(self, word_count: Dict[str, int], color_scheme: str = 'random',
+                            background_color: str = 'white', mask_image_path: Optional[str] = None,
+                            max_words: int = 50, fill_canvas: bool = False) -> Optional[WordCloud]:
+        """
+        Lay out the word cloud without displaying it.
         
-        return color_func
+        Placement is cached by frequencies, size, mask and settings, so
+        asking again with only a different color scheme or background
+        reuses the earlier layout and just repaints it.
+        """
+        return self._generate_word_cloud(word_count, color_scheme, background_color,
+                                         mask_image_path, max_words, fill_canvas)
     
-    def create_word_cloud(self, word_count: Dict[str, int], color_scheme: str = 'random', 
-                          background_color: str = 'white', mask_image_path: Optional[str] = None,max_words: int = 50, fill_canvas: bool = False) -> Optional[WordCloud]:
+    def generate_preview(self, word_count: Dict[str, int], color_scheme: str = 'random',
+                         background_color: str = 'white', mask_image_path: Optional[str] = None,
+                         max_words: int = 50, fill_canvas: bool = False,
+                         preview_scale: Optional[int] = None) -> Optional[WordCloud]:
         """
-        Create the word cloud visualization using the wordcloud library.
+        Quickly lay out the word cloud on a canvas preview_scale times
+        smaller than the configured size (Config.PREVIEW_SCALE by default).
+        
+        The result renders as a small preview image. Pass it to
+        upscale_preview for the full-size image of the same composition.
+        """
+        return self._generate_word_cloud(word_count, color_scheme, background_color,
+                                         mask_image_path, max_words, fill_canvas,
+                                         preview_scale or self.config.PREVIEW_SCALE)
+    
+    def upscale_preview(self, preview: WordCloud, preview_scale: Optional[int] = None) -> WordCloud:
+        """
+        Return a copy of a preview that renders at full size.
+        
+        The layout is reused as-is and only drawn with larger fonts, so the
+        full-size image matches the preview word for word.
+        """
+        wordcloud = copy.copy(preview)
+        wordcloud.scale = preview.scale * (preview_scale or self.config.PREVIEW_SCALE)
+        return wordcloud
+    
+    def render_poster(self, word_count: Dict[str, int], output_path: str, size: Tuple[int, int],
+                      color_scheme: str = 'random', background_color: str = 'white',
+                      mask_image_path: Optional[str] = None, max_words: int = 50,
+                      fill_canvas: bool = False) -> bool:
+        """
+        Render a word cloud of any size, e.g. for print, straight to a PNG file.
+        
+        The words are laid out on a canvas of the poster's proportions but
+        at most Config.POSTER_LAYOUT_MAX_PIXELS in area, then drawn scaled
+        up one band of Config.POSTER_BAND_HEIGHT rows at a time, each band
+        streamed into the PNG encoder before the next is drawn. Memory use
+        depends on the band size and the largest word, not the poster size.
+        """
+        width, height = size
+        layout_scale = max(1, math.ceil(math.sqrt(width * height / self.config.POSTER_LAYOUT_MAX_PIXELS)))
+        wordcloud = self._generate_word_cloud(word_count, color_scheme, background_color,
+                                              mask_image_path, max_words, fill_canvas,
+                                              canvas_size=(width // layout_scale, height // layout_scale))
+        if wordcloud is None:
+            return False
+        
+        # Scale the layout to the poster, keeping only words that are drawn
+        scale = min(width / wordcloud.width, height / wordcloud.height)
+        words = []
+        for (word, _), font_size, position, orientation, color in wordcloud.layout_:
+            poster_font_size = int(font_size * scale)
+            if poster_font_size < 1:
+                continue
+            _, word_height = _glyph_cache.measure(wordcloud.font_path, word, poster_font_size, orientation)
+            words.append((word, int(position[0] * scale), int(position[1] * scale),
+                          word_height, poster_font_size, orientation, color))
+        
+        # Written under a temporary name and renamed once complete, so a
+        # failed render never leaves a truncated PNG at output_path
+        band_height = self.config.POSTER_BAND_HEIGHT
+        temp_path = output_path + '.part'
+        try:
+            with open(temp_path, 'wb') as file, PngStreamWriter(file, width, height, wordcloud.mode) as writer:
+                for top in range(0, height, band_height):
+                    bottom = min(height, top + band_height)
+                    band = Image.new(wordcloud.mode, (width, bottom - top), background_color)
+                    draw = ImageDraw.Draw(band)
+                    for word, row, column, word_height, font_size, orientation, color in words:
+                        if row < bottom and row + word_height > top:
+                            draw.text((column, row - top), word, fill=color,
+                                      font=_load_font(wordcloud.font_path, font_size, orientation))
+                    writer.write_rows(band.tobytes())
+            os.replace(temp_path, output_path)
+            print(f"Word cloud poster saved as '{output_path}'")
+            return True
+        except Exception as e:
+            print(f"Error saving word cloud poster: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+    
+    def render_sequence(self, frequency_tables: Iterable[Dict[str, int]], output_path: str,
+                        color_scheme: str = 'random', background_color: str = 'white',
+                        mask_image_path: Optional[str] = None, max_words: int = 50,
+                        fill_canvas: bool = False, frame_duration_ms: Optional[int] = None) -> bool:
+        """
+        Render a series of frequency tables as frames of one evolving cloud.
+        
+        Words that persist from frame to frame stay in place and keep their
+        color; only new, resized or removed words are laid out again (see
+        SequenceLayout). An output_path ending in .gif or .webp is written
+        as an animation showing each frame for frame_duration_ms
+        (Config.SEQUENCE_FRAME_DURATION_MS by default); any other path is
+        used as a pattern for numbered PNGs, e.g. 'cloud.png' becomes
+        'cloud_0000.png', 'cloud_0001.png', ...
+        """
+        wordcloud, _, _ = self._new_word_cloud(background_color, mask_image_path, max_words, fill_canvas)
+        sequence = SequenceLayout(wordcloud, self.layout_engine)
+        root, extension = os.path.splitext(output_path)
+        animated = extension.lower() in ('.gif', '.webp')
+        
+        frames = []
+        colors = {}
+        try:
+            for index, word_count in enumerate(frequency_tables):
+                frame = sequence.advance(word_count)
+                frame_colors = self.color_engine.assign_colors(frame.layout_, color_scheme, colors)
+                frame.layout_ = [
+                    (word_freq, font_size, position, orientation, color)
+                    for (word_freq, font_size, position, orientation, _), color in zip(frame.layout_, frame_colors)
+                ]
+                colors = {word_freq[0]: color for (word_freq, *_), color in zip(frame.layout_, frame_colors)}
+                
+                if animated:
+                    frames.append(frame.to_image())
+                else:
+                    frame.to_file(f"{root}_{index:04d}.png")
+            
+            if animated:
+                if not frames:
+                    print("No frames to save!")
+                    return False
+                frames[0].save(output_path, save_all=True, append_images=frames[1:], loop=0,
+                               duration=frame_duration_ms or self.config.SEQUENCE_FRAME_DURATION_MS)
+            print(f"Word cloud sequence saved as '{output_path}'")
+            return True
+        except Exception as e:
+            print(f"Error saving word cloud sequence: {e}")
+            return False
+    
+    def _generate_word_cloud(self, word_count: Dict[str, int], color_scheme: str,
+                             background_color: str, mask_image_path: Optional[str],
+                             max_words: int, fill_canvas: bool, downscale: int = 1,
+                             canvas_size: Optional[Tuple[int, int]] = None) -> Optional[WordCloud]:
+        """
+        Lay out the word cloud on a canvas downscale times smaller than
+        canvas_size, which defaults to the configured size.
         """
         if not word_count:
             print("No words to display!")
             return None
         
-        # mask = None
+        wordcloud, mask_key, settings = self._new_word_cloud(background_color, mask_image_path, max_words,
+                                                             fill_canvas, downscale, canvas_size)
+        size = (wordcloud.width, wordcloud.height)
+        print(f"Creating word cloud with {len(word_count)} unique words...")
+        
+        layout_key = self.layout_cache.make_key(
+            word_count, size, mask_key, wordcloud.max_words, dict(settings, layout_engine=self.config.LAYOUT_ENGINE)
+        )
+        document = self.layout_cache.get(layout_key)
+        if document is not None:
+            restore_layout(wordcloud, document)
+        else:
+            if self.config.LAYOUT_ENGINE == 'native':
+                self.layout_engine.generate(wordcloud, word_count)
+            else:
+                wordcloud.generate_from_frequencies(word_count)
+            self.layout_cache.put(layout_key, layout_to_document(wordcloud))
+        
+        return self.recolor_word_cloud(wordcloud, color_scheme, background_color)
+    
+    def _new_word_cloud(self, background_color: str, mask_image_path: Optional[str], max_words: int,
+                        fill_canvas: bool, downscale: int = 1,
+                        canvas_size: Optional[Tuple[int, int]] = None) -> Tuple[WordCloud, Optional[str], Dict[str, Any]]:
+        """
+        Create an ungenerated WordCloud with the configured settings.
+        
+        Returns the word cloud, the key of its prepared mask (None without
+        a mask) and the settings it was created with.
+        """
+        width, height = canvas_size or (self.width, self.height)
+        size = (width // downscale, height // downscale)
+        mask = None
+        mask_key = None
         if mask_image_path:
             try:
-                from PIL import Image
-                mask_image = Image.open(mask_image_path).convert("L")  # Grayscale
-                # Binarize: everything above 128 becomes 255 (white), else 0 (black)
-                mask_image = mask_image.point(lambda x: 255 if x > 128 else 0, mode='L')
-                mask = np.array(mask_image)
+                # Binarized and fitted to the canvas; cached across renders
+                mask = self.mask_cache.load(mask_image_path, size)
+                mask_key = self.mask_cache.make_key(mask_image_path, size)
                 print(f"Using custom shape from {mask_image_path}")
                 # if mask is not None:
                     # print(f"Mask shape: {mask.shape}, dtype: {mask.dtype}, unique values: {np.unique(mask)}")
@@ -62,8 +695,7 @@ class WordCloudVisualizer:
                 print(f"Could not load mask image: {e}")
                 print("Using default rectangular shape")
                 mask = None
-        
-        print(f"Creating word cloud with {len(word_count)} unique words...")
+                mask_key = None
         
         settings = self.wordcloud_settings.copy()
         
@@ -74,32 +706,42 @@ class WordCloudVisualizer:
             settings['margin'] = 0
             settings['prefer_horizontal'] = 0.5
             max_words = max(max_words, 200)  # Ensure more words if possible
+        
+        if downscale > 1:
+            # Pixel sizes shrink along with the canvas
+            for name in ('min_font_size', 'max_font_size', 'margin'):
+                if settings.get(name):
+                    settings[name] = max(1, round(settings[name] / downscale))
             
         settings.pop('background_color', None)
         settings.pop('max_words', None)
+        # Words are placed uncolored so the layout, and the random choices
+        # made during placement, do not depend on the color scheme
         wordcloud = WordCloud(
-            width=self.width,
-            height=self.height,
+            width=size[0],
+            height=size[1],
             background_color=background_color,
             mask=mask,
             max_words=max_words,
-            color_func=self.get_color_function(color_scheme),
+            color_func=_uncolored,
             **settings
-        ).generate_from_frequencies(word_count)
-        
-        # Create the plot
-        plt.figure(figsize=(self.width/100, self.height/100), facecolor=background_color)
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')  # Remove axes for cleaner look
-        plt.title('Word Cloud', fontsize=16, pad=20)
-        plt.tight_layout(pad=0)
-        plt.gca().set_facecolor(background_color)  # Set axes background
-        
-        # Show the plot
-        plt.show()
-        
-        plt.savefig('wordcloud.png', bbox_inches='tight', pad_inches=0, transparent=True)
+        )
         
+        return wordcloud, mask_key, settings
+    
+    def recolor_word_cloud(self, wordcloud: WordCloud, color_scheme: str = 'random',
+                           background_color: Optional[str] = None) -> WordCloud:
+        """
+        Repaint an existing word cloud's layout with another color scheme
+        and, optionally, another background color.
+        """
+        if background_color is not None:
+            wordcloud.background_color = background_color
+        colors = self.color_engine.assign_colors(wordcloud.layout_, color_scheme)
+        wordcloud.layout_ = [
+            (word_freq, font_size, position, orientation, color)
+            for (word_freq, font_size, position, orientation, _), color in zip(wordcloud.layout_, colors)
+        ]
         return wordcloud
     
     def save_word_cloud(self, wordcloud: WordCloud, filename: str = 'wordcloud.png') -> bool:
@@ -118,6 +760,64 @@ class WordCloudVisualizer:
             print(f"Error saving word cloud: {e}")
             return False
     
+    def export_word_cloud(self, wordcloud: WordCloud, base_path: str = 'wordcloud',
+                          formats: Optional[List[str]] = None,
+                          thumbnail_sizes: Optional[List[Tuple[int, int]]] = None,
+                          primary_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Render the word cloud once and write it in several formats and
+        thumbnail sizes in parallel (Config.EXPORT_* by default). The first
+        format goes to primary_path, if given, rather than base_path.
+        
+        Returns a report per output file with its size in bytes and the
+        time spent encoding it.
+        """
+        if wordcloud is None:
+            print("No word cloud to export!")
+            return []
+        
+        reports = self.exporter.export(
+            wordcloud.to_image(), base_path, formats, thumbnail_sizes, primary_path
+        )
+        for report in reports:
+            if report['success']:
+                print(f"Saved '{report['path']}' ({report['bytes']:,} bytes, {report['seconds'] * 1000:.0f} ms)")
+            else:
+                print(f"Error saving '{report['path']}': {report['error']}")
+        return reports
+    
+    def save_layout(self, wordcloud: WordCloud, filepath: str) -> bool:
+        """
+        Save the word cloud's finished layout as a LayoutDocument: JSON if
+        filepath ends in .json, otherwise the compact binary format.
+        """
+        if wordcloud is None:
+            print("No word cloud to save!")
+            return False
+        
+        if LayoutDocument.from_word_cloud(wordcloud).save(filepath):
+            print(f"Word cloud layout saved as '{filepath}'")
+            return True
+        return False
+    
+    def render_layout(self, document: LayoutDocument, output_path: str, scale: float = 1.0,
+                      color_scheme: Optional[str] = None, background_color: Optional[str] = None) -> bool:
+        """
+        Draw a saved layout as an image, or as SVG if output_path ends in
+        .svg, without laying out or processing any text.
+        """
+        try:
+            if output_path.lower().endswith('.svg'):
+                with open(output_path, 'w', encoding='utf-8') as file:
+                    file.write(document.to_svg(scale, color_scheme, background_color))
+            else:
+                document.render(scale, color_scheme, background_color).save(output_path)
+            print(f"Word cloud saved as '{output_path}'")
+            return True
+        except Exception as e:
+            print(f"Error rendering word cloud layout: {e}")
+            return False
+    
     def get_word_cloud_info(self, wordcloud: WordCloud) -> Dict[str, Any]:
         """
         Get information about the generated word cloud.
@@ -130,7 +830,8 @@ class WordCloudVisualizer:
         info = {
             'total_words_displayed': len(layout),
             'image_size': (wordcloud.width, wordcloud.height),
-            'words_with_positions': layout[:self.config.UI_SETTINGS['max_display_words']] if layout else []  # Show top N
+            'words_with_positions': layout[:self.config.UI_SETTINGS['max_display_words']] if layout else [],  # Show top N
+            'layout_document': LayoutDocument.from_word_cloud(wordcloud)  # Full layout, to save and render elsewhere
         }
         
         return info